@@ -9,6 +9,14 @@ import os
 import re
 from urllib.parse import parse_qs, urlparse
 
+# Optional: faster JSON encoding/decoding (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_parse_json = orjson.loads if orjson is not None else json.loads
+
 # Vercel Blob SDK
 try:
     from vercel_blob import put, list as blob_list, delete as blob_delete, head
@@ -19,9 +27,20 @@ except ImportError:
 BLOB_TOKEN = os.environ.get('BLOB_READ_WRITE_TOKEN', '')
 
 
+_UNSAFE_NAME_RE = re.compile(r'[^a-z0-9-]')
+_DESCRIPTION_RE = re.compile(r'^description:(.*)$', re.M)
+
+
+def _dump_meta(meta: dict) -> bytes:
+    """Encode _meta.json with 2-space indentation, in C when orjson is installed."""
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    return json.dumps(meta, indent=2).encode('utf-8')
+
+
 def sanitize_name(name: str) -> str:
     """Convert name to valid skill directory name."""
-    return re.sub(r'[^a-z0-9-]', '-', name.lower().strip()).strip('-')
+    return _UNSAFE_NAME_RE.sub('-', name.lower().strip()).strip('-')
 
 
 def get_skill_path(name: str, filename: str = 'SKILL.md') -> str:
@@ -71,10 +90,9 @@ async def list_skills():
                         if content.startswith('---'):
                             try:
                                 end = content.index('---', 3)
-                                for line in content[3:end].split('\n'):
-                                    if line.startswith('description:'):
-                                        skill_data['description'] = line.split(':', 1)[1].strip()
-                                        break
+                                match = _DESCRIPTION_RE.search(content, 3, end)
+                                if match:
+                                    skill_data['description'] = match.group(1).strip()
                             except ValueError:
                                 pass
             except Exception:
@@ -87,7 +105,7 @@ async def list_skills():
                 if blob_info:
                     from urllib.request import urlopen
                     with urlopen(blob_info['url']) as response:
-                        meta = json.loads(response.read().decode('utf-8'))
+                        meta = _parse_json(response.read())
                         skill_data.update(meta)
             except Exception:
                 pass
@@ -125,7 +143,7 @@ async def get_skill(name: str):
             meta_info = head(meta_path, token=BLOB_TOKEN)
             if meta_info:
                 with urlopen(meta_info['url']) as response:
-                    meta = json.loads(response.read().decode('utf-8'))
+                    meta = _parse_json(response.read())
                     skill_data.update(meta)
         except Exception:
             pass
@@ -179,7 +197,7 @@ description: {description}
         }
         put(
             get_skill_path(name, '_meta.json'),
-            json.dumps(meta, indent=2).encode('utf-8'),
+            _dump_meta(meta),
             {'access': 'public', 'token': BLOB_TOKEN}
         )
 
@@ -220,7 +238,7 @@ description: {description}
         }
         put(
             get_skill_path(name, '_meta.json'),
-            json.dumps(meta, indent=2).encode('utf-8'),
+            _dump_meta(meta),
             {'access': 'public', 'token': BLOB_TOKEN}
         )
 
@@ -258,7 +276,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode())
 
     def do_OPTIONS(self):
         self._send_response({})
@@ -282,7 +300,7 @@ class handler(BaseHTTPRequestHandler):
     def do_POST(self):
         content_length = int(self.headers.get('Content-Length', 0))
         body = self.rfile.read(content_length)
-        data = json.loads(body) if body else {}
+        data = _parse_json(body) if body else {}
 
         import asyncio
 
@@ -302,7 +320,7 @@ class handler(BaseHTTPRequestHandler):
             name = path.replace('/api/skills/', '')
             content_length = int(self.headers.get('Content-Length', 0))
             body = self.rfile.read(content_length)
-            data = json.loads(body) if body else {}
+            data = _parse_json(body) if body else {}
 
             import asyncio
             result, status = asyncio.run(update_skill(name, data))
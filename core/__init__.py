@@ -2,20 +2,30 @@
 # Shared functionality between API server and standalone app
 
 from .config import get_skills_dir, get_app_dir, find_claude_cli
-from .utils import sanitize_name, extract_description_from_frontmatter, parse_frontmatter
+from .utils import (
+    sanitize_name,
+    extract_description_from_frontmatter,
+    extract_name_and_description,
+    parse_frontmatter,
+)
 from .skills import (
     list_all_skills,
+    iter_all_skills,
+    skills_etag,
     get_skill_by_name,
     create_skill,
     update_skill,
     delete_skill,
     import_folder,
     import_files_json,
+    purge_trash,
 )
 from .browse import browse_skills_directory
 from .claude_cli import (
     get_claude_status,
+    clear_claude_cli_cache,
     run_claude_prompt,
+    stream_claude_prompt,
     generate_skill_with_claude,
     improve_skill_with_claude,
 )
@@ -28,20 +38,26 @@ __all__ = [
     # Utils
     'sanitize_name',
     'extract_description_from_frontmatter',
+    'extract_name_and_description',
     'parse_frontmatter',
     # Skills CRUD
     'list_all_skills',
+    'iter_all_skills',
+    'skills_etag',
     'get_skill_by_name',
     'create_skill',
     'update_skill',
     'delete_skill',
     'import_folder',
     'import_files_json',
+    'purge_trash',
     # Browse (restricted)
     'browse_skills_directory',
     # Claude CLI
     'get_claude_status',
+    'clear_claude_cli_cache',
     'run_claude_prompt',
+    'stream_claude_prompt',
     'generate_skill_with_claude',
     'improve_skill_with_claude',
 ]
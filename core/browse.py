@@ -2,11 +2,22 @@
 # RESTRICTED filesystem browser - ONLY allows browsing within skills/ directory
 # This is a SECURITY-CRITICAL module
 
+import heapq
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .config import get_skills_dir
 
+MAX_LISTED_ENTRIES = 100  # Per list (dirs and files) in one browse response
+
+
+@lru_cache(maxsize=4)
+def _resolved_skills_dir(skills_dir: Path) -> Path:
+    """Resolve the skills directory once rather than on every browse."""
+    return skills_dir.resolve()
+
 
 def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | None, str | None]:
     """
@@ -41,12 +52,10 @@ def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | N
     try:
         # resolve() will follow symlinks and normalize the path
         resolved_target = target_path.resolve()
-        resolved_skills = skills_dir.resolve()
 
         # Check that target is within or equal to skills directory
-        if not (resolved_target == resolved_skills or
-                str(resolved_target).startswith(str(resolved_skills) + "/" ) or
-                str(resolved_target).startswith(str(resolved_skills) + "\\")):
+        # (compared by path parts, so "skills2" is not inside "skills")
+        if not resolved_target.is_relative_to(_resolved_skills_dir(skills_dir)):
             return None, "Access denied: Path outside skills directory"
     except (OSError, ValueError):
         return None, "Invalid path"
@@ -57,34 +66,44 @@ def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | N
     if not target_path.is_dir():
         return None, "Path is not a directory"
 
-    dirs = []
-    files = []
+    dir_names = []
+    file_names = []
 
     try:
-        for item in sorted(target_path.iterdir()):
-            # Skip hidden files
-            if item.name.startswith('.'):
-                continue
-
-            # Get path relative to skills directory
-            rel_path = str(item.relative_to(skills_dir))
-
-            if item.is_dir():
-                # Check if it looks like a skill folder
-                is_skill = (item / "SKILL.md").exists()
-                dirs.append({
-                    "name": item.name,
-                    "path": rel_path,
-                    "is_skill": is_skill,
-                })
-            else:
-                files.append({
-                    "name": item.name,
-                    "path": rel_path,
-                })
+        with os.scandir(target_path) as it:
+            for entry in it:
+                # Skip hidden files
+                if entry.name.startswith('.'):
+                    continue
+
+                # DirEntry caches the file type, so this costs no extra stat()
+                if entry.is_dir():
+                    dir_names.append(entry.name)
+                else:
+                    file_names.append(entry.name)
     except PermissionError:
         return None, "Permission denied"
 
+    # Entry paths relative to the skills directory share this prefix
+    rel_prefix = str(target_path.relative_to(skills_dir))
+    rel_prefix = "" if rel_prefix == "." else rel_prefix + os.sep
+
+    # Keep the alphabetically first entries without sorting the whole folder;
+    # dicts (and the SKILL.md check) are built only for those
+    dirs = [
+        {
+            "name": name,
+            "path": rel_prefix + name,
+            # Check if it looks like a skill folder
+            "is_skill": os.path.exists(os.path.join(target_path, name, "SKILL.md")),
+        }
+        for name in heapq.nsmallest(MAX_LISTED_ENTRIES, dir_names)
+    ]
+    files = [
+        {"name": name, "path": rel_prefix + name}
+        for name in heapq.nsmallest(MAX_LISTED_ENTRIES, file_names)
+    ]
+
     # Calculate parent path (only if we're not at root)
     parent = None
     if relative_path:
@@ -97,8 +116,8 @@ def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | N
     return {
         "path": relative_path or "",
         "parent": parent,
-        "dirs": dirs[:100],  # Limit results
-        "files": files[:100],
+        "dirs": dirs,  # At most MAX_LISTED_ENTRIES each
+        "files": files,
         "restricted": True,  # Flag indicating this is the restricted browser
         "base_dir": "skills/",  # Inform client of the base directory
     }, None
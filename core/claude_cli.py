@@ -1,10 +1,46 @@
 # core/claude_cli.py
 # Claude Code CLI integration
 
+import os
 import subprocess
-from typing import Any
+import threading
+from functools import lru_cache
+from typing import Any, Iterator
 
 from .config import find_claude_cli, get_skills_dir
+from .utils import extract_name_and_description
+
+MAX_OUTPUT_CHARS = 1 << 20  # Characters kept from the start of each CLI output stream
+OUTPUT_CHUNK_CHARS = 1 << 16
+# A cut-off SKILL.md is unusable, so generate/improve fail instead of returning one
+OUTPUT_TOO_LONG = f"Claude output exceeded {MAX_OUTPUT_CHARS} characters"
+
+# The CLI writes UTF-8; decode it as such rather than in the locale encoding
+# (e.g. cp1252 on Windows), replacing any invalid bytes instead of raising
+CLI_TEXT = {"encoding": "utf-8", "errors": "replace"}
+
+# At most this many CLI processes run at once; further callers queue for a
+# slot for up to their own timeout
+MAX_CONCURRENT_RUNS = int(os.environ.get("SKILLS_CLAUDE_MAX_RUNS", "2"))
+_RUN_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_RUNS)
+
+
+@lru_cache(maxsize=4)
+def _cli_version(cli_path: str) -> str:
+    """Return `<cli> --version` output; cached, as it only changes on reinstall."""
+    result = subprocess.run(
+        [cli_path, '--version'],
+        capture_output=True,
+        **CLI_TEXT,
+        timeout=5
+    )
+    return result.stdout.strip() or result.stderr.strip()
+
+
+def clear_claude_cli_cache() -> None:
+    """Forget the cached CLI location and version so both are probed again."""
+    find_claude_cli.cache_clear()
+    _cli_version.cache_clear()
 
 
 def get_claude_status() -> dict[str, Any]:
@@ -15,13 +51,7 @@ def get_claude_status() -> dict[str, Any]:
         return {"available": False, "error": "Claude Code CLI not found"}
 
     try:
-        result = subprocess.run(
-            [cli_path, '--version'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        version = result.stdout.strip() or result.stderr.strip()
+        version = _cli_version(cli_path)
         return {"available": True, "path": cli_path, "version": version}
     except subprocess.TimeoutExpired:
         return {"available": False, "error": "CLI timed out"}
@@ -29,6 +59,95 @@ def get_claude_status() -> dict[str, Any]:
         return {"available": False, "error": str(e)}
 
 
+def _read_head(stream, output: dict[str, tuple[str, bool]], key: str) -> None:
+    """
+    Read stream to EOF, storing (its first MAX_OUTPUT_CHARS characters,
+    whether anything beyond them was dropped) in output[key].
+    """
+    chunks = []
+    size = 0
+    truncated = False
+    for chunk in iter(lambda: stream.read(OUTPUT_CHUNK_CHARS), ""):
+        if size < MAX_OUTPUT_CHARS:
+            chunk_size = len(chunk)
+            if size + chunk_size > MAX_OUTPUT_CHARS:
+                chunk = chunk[:MAX_OUTPUT_CHARS - size]
+                truncated = True
+            chunks.append(chunk)
+            size += chunk_size
+        else:
+            # Keep draining so the CLI never blocks on a full pipe
+            truncated = True
+    output[key] = ("".join(chunks), truncated)
+
+
+def _run_cli(args: list[str], timeout: float, cwd: str | None = None) -> tuple[int, str, str, bool]:
+    """
+    Run the CLI and return (returncode, stdout, stderr, truncated), reading
+    the output pipes as the CLI writes them rather than buffering them whole.
+
+    Both pipes are drained concurrently (a full pipe would block the CLI) and
+    only the first MAX_OUTPUT_CHARS of each is kept, so a runaway CLI cannot
+    grow memory without bound; truncated says whether either was cut.
+    Raises subprocess.TimeoutExpired, after killing the CLI, on timeout (or
+    if no run slot frees up within timeout).
+    """
+    if not _RUN_SLOTS.acquire(timeout=timeout):
+        raise subprocess.TimeoutExpired(args[0], timeout)
+    try:
+        return _run_cli_process(args, timeout, cwd)
+    finally:
+        _RUN_SLOTS.release()
+
+
+def _run_cli_process(args: list[str], timeout: float, cwd: str | None) -> tuple[int, str, str, bool]:
+    """Body of _run_cli, run while holding a slot."""
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **CLI_TEXT,
+        cwd=cwd,
+    )
+
+    output: dict[str, tuple[str, bool]] = {}
+    readers = [
+        threading.Thread(target=_read_head, args=(process.stdout, output, "stdout"), daemon=True),
+        threading.Thread(target=_read_head, args=(process.stderr, output, "stderr"), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+
+    stdout, stdout_truncated = output.get("stdout", ("", False))
+    stderr, stderr_truncated = output.get("stderr", ("", False))
+    return returncode, stdout, stderr, stdout_truncated or stderr_truncated
+
+
+def _release_slot_on_exit(process: subprocess.Popen) -> None:
+    """Free a run slot once a streamed CLI process has exited."""
+    try:
+        process.wait()
+    finally:
+        _RUN_SLOTS.release()
+
+
+def _build_prompt(prompt: str, skill_context: str) -> str:
+    """Prepend optional skill context to a user prompt."""
+    if skill_context:
+        return f"Using this skill context:\n\n{skill_context}\n\n{prompt}"
+    return prompt
+
+
 def run_claude_prompt(
     prompt: str,
     skill_context: str = "",
@@ -47,29 +166,80 @@ def run_claude_prompt(
     if not cli_path:
         return None, "Claude Code CLI not found"
 
-    full_prompt = prompt
-    if skill_context:
-        full_prompt = f"Using this skill context:\n\n{skill_context}\n\n{prompt}"
-
     try:
-        result = subprocess.run(
-            [cli_path, '-p', full_prompt],
-            capture_output=True,
-            text=True,
+        returncode, stdout, stderr, truncated = _run_cli(
+            [cli_path, '-p', _build_prompt(prompt, skill_context)],
+            timeout=120,
             cwd=str(get_skills_dir()),
-            timeout=120
         )
-        return {
-            "success": True,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
-        }, None
     except subprocess.TimeoutExpired:
         return None, "Timeout"
     except Exception as e:
         return None, str(e)
 
+    return {
+        "success": True,
+        "stdout": stdout,
+        "stderr": stderr,
+        "returncode": returncode,
+        "truncated": truncated,
+    }, None
+
+
+def stream_claude_prompt(
+    prompt: str,
+    skill_context: str = "",
+    timeout: float = 120,
+) -> tuple[Iterator[str] | None, str | None]:
+    """
+    Run a prompt through Claude CLI, streaming its output as it is produced.
+
+    The CLI is started immediately; the returned iterator yields output lines
+    (stderr merged into stdout) until the process exits. The process is
+    killed after timeout seconds, or if the iterator is closed early (e.g. the
+    HTTP client disconnects).
+
+    Returns:
+        Tuple of (output_iterator, error_message)
+    """
+    cli_path = find_claude_cli()
+    if not cli_path:
+        return None, "Claude Code CLI not found"
+
+    if not _RUN_SLOTS.acquire(timeout=timeout):
+        return None, "Timeout"
+    try:
+        process = subprocess.Popen(
+            [cli_path, '-p', _build_prompt(prompt, skill_context)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            **CLI_TEXT,
+            cwd=str(get_skills_dir()),
+        )
+    except Exception as e:
+        _RUN_SLOTS.release()
+        return None, str(e)
+
+    # The slot is held for the life of the process, even if the iterator is
+    # never consumed (the timer below still kills it)
+    threading.Thread(target=_release_slot_on_exit, args=(process,), daemon=True).start()
+
+    timer = threading.Timer(timeout, process.kill)
+    timer.daemon = True
+    timer.start()
+
+    def output() -> Iterator[str]:
+        try:
+            yield from process.stdout
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+    return output(), None
+
 
 def generate_skill_with_claude(idea: str) -> tuple[dict[str, Any] | None, str | None]:
     """
@@ -117,27 +287,15 @@ Example
 Only output the SKILL.md content."""
 
     try:
-        result = subprocess.run(
-            [cli_path, '-p', prompt, '--output-format', 'text'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
-        output = result.stdout.strip()
+        _, stdout, _, truncated = _run_cli([cli_path, '-p', prompt, '--output-format', 'text'], timeout=180)
+        if truncated:
+            return None, OUTPUT_TOO_LONG
+        output = stdout.strip()
 
         skill_data = {"content": output}
 
         # Try to extract name and description from frontmatter
-        if output.startswith("---"):
-            try:
-                end = output.index("---", 3)
-                for line in output[3:end].split("\n"):
-                    if line.startswith("name:"):
-                        skill_data["name"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("description:"):
-                        skill_data["description"] = line.split(":", 1)[1].strip()
-            except ValueError:
-                pass
+        skill_data.update(extract_name_and_description(output))
 
         return {"success": True, "skill": skill_data}, None
     except subprocess.TimeoutExpired:
@@ -179,15 +337,12 @@ Current SKILL.md:
 Output the complete improved SKILL.md file only."""
 
     try:
-        result = subprocess.run(
-            [cli_path, '-p', prompt, '--output-format', 'text'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        _, stdout, _, truncated = _run_cli([cli_path, '-p', prompt, '--output-format', 'text'], timeout=180)
+        if truncated:
+            return None, OUTPUT_TOO_LONG
         return {
             "success": True,
-            "improved_content": result.stdout.strip(),
+            "improved_content": stdout.strip(),
             "original_content": current_content,
         }, None
     except subprocess.TimeoutExpired:
@@ -0,0 +1,54 @@
+# core/compress.py
+# gzip compression for JSON responses (skill lists, skill details, browse results)
+
+import gzip
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Flask, Response, request
+
+COMPRESS_MIMETYPES = frozenset({"application/json"})
+COMPRESS_MIN_SIZE = 1024  # Smaller bodies are sent as-is; gzip would save little
+COMPRESS_LEVEL = 6
+
+
+def _gzip_stream(chunks: Iterable[str | bytes]) -> Iterator[bytes]:
+    """Compress a streamed body as it is produced."""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _compress_response(response: Response) -> Response:
+    """Gzip JSON responses for clients that accept it."""
+    if (
+        response.mimetype not in COMPRESS_MIMETYPES
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if request.accept_encodings["gzip"] <= 0:
+        return response
+
+    if response.is_streamed:
+        # Length unknown up front, so compress every streamed list
+        response.response = _gzip_stream(response.response)
+        response.headers.pop("Content-Length", None)
+    else:
+        body = response.get_data()
+        if len(body) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(body, COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def configure_compression(app: Flask) -> None:
+    """Gzip the app's JSON responses when the client sends Accept-Encoding: gzip."""
+    app.after_request(_compress_response)
@@ -4,6 +4,7 @@
 import os
 import sys
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 # Cache for computed paths
@@ -33,6 +34,7 @@ def get_skills_dir() -> Path:
     return _skills_dir
 
 
+@lru_cache(maxsize=1)
 def find_claude_cli() -> str | None:
     """
     Find the Claude Code CLI executable using portable path resolution.
@@ -45,28 +47,24 @@ def find_claude_cli() -> str | None:
     5. ~/.claude/local/claude (Unix alternate)
 
     NO hardcoded usernames or absolute paths.
+
+    The result is cached for the life of the process; call
+    find_claude_cli.cache_clear() to probe again.
     """
     # First, check PATH
     cli_path = shutil.which('claude')
     if cli_path:
         return cli_path
 
-    # Check standard Claude installation locations using expanduser
+    # Check standard Claude installation locations using expanduser, then
+    # fall back to the current directory
     home = Path.home()
     possible_locations = [
-        home / '.claude' / 'claude.exe',
-        home / '.claude' / 'claude',
-        home / '.claude' / 'local' / 'claude.exe',
-        home / '.claude' / 'local' / 'claude',
+        str(home / '.claude' / 'claude.exe'),
+        str(home / '.claude' / 'claude'),
+        str(home / '.claude' / 'local' / 'claude.exe'),
+        str(home / '.claude' / 'local' / 'claude'),
+        'claude.exe',
+        'claude',
     ]
-
-    for path in possible_locations:
-        if path.exists():
-            return str(path)
-
-    # Final fallback - maybe it's in current directory
-    for name in ['claude.exe', 'claude']:
-        if os.path.exists(name):
-            return name
-
-    return None
+    return next((path for path in possible_locations if os.path.exists(path)), None)
@@ -0,0 +1,79 @@
+# core/json_provider.py
+# Flask JSON provider backed by orjson (falls back to Flask's default)
+
+import json
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+from flask import Flask, Response, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+# Optional: faster JSON encoding/decoding (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson, encoding UTF-8 in C."""
+
+    def _option(self, sort_keys: bool, indent: bool) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._option(kwargs.get("sort_keys", self.sort_keys), bool(kwargs.get("indent")))
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Like DefaultJSONProvider.response, but hands orjson's bytes straight to the response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        option = self._option(self.sort_keys, indent) | orjson.OPT_APPEND_NEWLINE
+        body = orjson.dumps(obj, default=self.default, option=option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def configure_json_provider(app: Flask) -> None:
+    """Use OrjsonProvider for jsonify and request parsing when orjson is installed."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+def stream_json_list(key: str, items: Iterable[Any]) -> Response:
+    """
+    Stream {key: [item, ...]} as a JSON response, encoding one item at a time.
+
+    Peak memory is bounded by the largest item rather than the whole list,
+    and the first bytes go out before items has been exhausted.
+    """
+    def generate() -> Iterator[str]:
+        yield f'{{"{key}":['
+        separator = ""
+        for item in items:
+            yield separator + current_app.json.dumps(item)
+            separator = ","
+        yield "]}"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+@lru_cache(maxsize=256)
+def _error_body(message: str) -> bytes:
+    """Encode an error payload once per distinct message."""
+    if orjson is not None:
+        return orjson.dumps({"error": message}) + b"\n"
+    return json.dumps({"error": message}).encode("utf-8") + b"\n"
+
+
+def error_response(message: str, status: int) -> Response:
+    """Build a JSON {"error": message} response from a cached encoded body."""
+    return Response(_error_body(message), status=status, mimetype="application/json")
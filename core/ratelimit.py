@@ -0,0 +1,67 @@
+# core/ratelimit.py
+# Per-client rate limiting for expensive routes (Claude CLI runs)
+
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from functools import wraps
+
+from flask import request
+
+from .json_provider import error_response
+
+# Claude CLI runs allowed per client per window; 0 disables the limit
+CLAUDE_RATE_LIMIT = int(os.environ.get("SKILLS_CLAUDE_RATE_LIMIT", "10"))
+CLAUDE_RATE_WINDOW = 60  # Seconds
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter: at most `limit` calls per `window` seconds per
+    client address. The apps listen on localhost, so in practice every
+    browser tab shares one budget.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._hits: defaultdict[str, deque[float]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def allow(self, key: str) -> bool:
+        """Record a call for key and return whether it is within the limit."""
+        if self.limit <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.window:
+                # Forget clients whose calls have all expired (at most once per window)
+                self._last_sweep = now
+                for stale in [k for k, h in self._hits.items() if not h or now - h[-1] >= self.window]:
+                    del self._hits[stale]
+            hits = self._hits[key]
+            while hits and now - hits[0] >= self.window:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False
+            hits.append(now)
+            return True
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._hits.clear()
+
+    def __call__(self, view):
+        """Decorate a Flask view to answer 429 once its caller is over the limit."""
+        @wraps(view)
+        def limited(*args, **kwargs):
+            if not self.allow(request.remote_addr or ""):
+                return error_response("Too many Claude requests; try again shortly", 429)
+            return view(*args, **kwargs)
+        return limited
+
+
+claude_rate_limit = RateLimiter(CLAUDE_RATE_LIMIT, CLAUDE_RATE_WINDOW)
@@ -2,61 +2,396 @@
 # Skills CRUD operations
 
 import json
+import os
+import re
 import shutil
-import base64
+import binascii
+import hashlib
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+# Optional: faster JSON parsing (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import get_skills_dir
 from .utils import sanitize_name, extract_description_from_frontmatter, create_skill_markdown
 
 
-def list_all_skills() -> list[dict[str, Any]]:
-    """List all skills with their metadata."""
-    skills_dir = get_skills_dir()
-    skills = []
+_parse_json = orjson.loads if orjson is not None else json.loads
 
-    if not skills_dir.exists():
-        return skills
 
-    for skill_dir in skills_dir.iterdir():
-        if not skill_dir.is_dir():
-            continue
+def _dump_meta(meta: dict[str, Any]) -> bytes:
+    """Serialize _meta.json content with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    return json.dumps(meta, indent=2).encode("utf-8")
+
+
+FRONTMATTER_CHUNK_BYTES = 4096  # SKILL.md is read in these steps when only frontmatter is needed
+COPY_CHUNK_BYTES = 1 << 30  # Max bytes per copy_file_range call
+IMPORT_MAX_WORKERS = 32  # Cap on concurrent file writes per import (bounds open fds)
+BASE64_STREAM_MIN = 1 << 20  # Base64 uploads longer than this are decoded while writing
+BASE64_CHUNK_CHARS = 4 << 20  # Characters decoded per chunk (a multiple of 4)
+_BASE64_NON_ALPHABET_RE = re.compile(r"[^A-Za-z0-9+/=]")
+
+# Reads skill folders for large listings
+LIST_PARALLEL_MIN = 8  # Fewer skills than this are listed on the calling thread
+_LIST_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="skill-list")
+
+# Removes deleted skill folders after they are renamed into TRASH_DIR_NAME.
+# Names starting with "." inside the skills directory are never listed as skills.
+TRASH_DIR_NAME = ".trash"  # Folder inside the skills directory for removed skills awaiting deletion
+STAGING_DIR_NAME = ".staging"  # Folder inside the skills directory for imports being written
+STAGING_MAX_AGE = 3600  # Seconds before purge_trash treats a staging folder as abandoned
+_DELETE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="skill-delete")
+
+# Parsed _meta.json / SKILL.md contents: path -> ((mtime_ns, size), value)
+_FILE_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+# Listing workers and server threads share _FILE_CACHE; held only around dict access
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 file bytes the way Path.read_text does (universal newlines)."""
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_cached(path: str | Path, parse, read=None) -> Any:
+    """
+    Return parse(file bytes), reusing the previous result while the file's
+    mtime and size are unchanged. With read, parse gets read(file) instead
+    of the whole file (cached separately from full reads).
+
+    Raises FileNotFoundError if the file is missing. Callers must not mutate
+    the returned value.
+    """
+    path = str(path)
+    key = path if read is None else f"{path}#{read.__name__}"
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if read is None:
+        value = parse(_read_whole(path, st.st_size))
+    else:
+        with open(path, "rb") as f:
+            value = parse(read(f))
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = (signature, value)
+    return value
+
+
+def _read_whole(path: str, size: int) -> bytes:
+    """
+    Read a file whose size is already known from os.stat with raw os.read
+    calls: no buffered file object, and no fstat/lseek to size the buffer.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        # Normally one read returns the whole file and the next returns b""
+        while chunk := os.read(fd, size + 1):
+            chunks.append(chunk)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_frontmatter(f) -> bytes:
+    """
+    Read a SKILL.md only as far as its closing frontmatter '---' (or not at
+    all past the first chunk when it has no frontmatter).
+    """
+    head = f.read(FRONTMATTER_CHUNK_BYTES)
+    if not head.startswith(b"---"):
+        return head
+    while head.find(b"---", 3) < 0:
+        chunk = f.read(FRONTMATTER_CHUNK_BYTES)
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _head_description(head: bytes) -> str | None:
+    """Extract the frontmatter description from the start of a SKILL.md."""
+    return extract_description_from_frontmatter(head.decode("utf-8", errors="replace"))
+
+
+def _skill_md_description(path: str | Path) -> str | None:
+    """Read only a SKILL.md's frontmatter from disk and return its description."""
+    with open(path, "rb") as f:
+        return _head_description(_read_frontmatter(f))
+
+
+def _atomic_write_chunks(path: str | Path, chunks: Iterable[bytes]) -> None:
+    """
+    Write chunks to path via a temporary file and os.replace, so readers (and
+    a crash mid-write) never see a half-written file.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        # Unbuffered: a SKILL.md or _meta.json usually goes out in one write
+        try:
+            for data in chunks:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(path: str | Path, data: bytes) -> None:
+    """Atomically write data to path (see _atomic_write_chunks)."""
+    _atomic_write_chunks(path, (data,))
+
+
+def _atomic_write_text(path: str | Path, text: str) -> None:
+    """Atomically write UTF-8 text to path."""
+    _atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def _invalidate_skill_cache(skill_dir: Path) -> None:
+    """Drop cached files under skill_dir after it is written or removed."""
+    prefix = str(skill_dir) + os.sep
+    with _FILE_CACHE_LOCK:
+        for key in [k for k in _FILE_CACHE if k.startswith(prefix)]:
+            del _FILE_CACHE[key]
+
+
+def _scandir_recursive(path):
+    """Yield a DirEntry for every file and directory below path.
+
+    DirEntry caches the file type from the directory listing, so unlike
+    Path.rglob no extra stat() call is made per entry. Symlinked directories
+    are not followed; unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+    except PermissionError:
+        pass
+
+
+def _iter_relative_files(path, prefix: str = "") -> Iterator[str]:
+    """
+    Yield the path of every file below path relative to it, building each
+    from its parent's prefix rather than calling os.path.relpath per file.
+    """
+    for entry in _scandir_level(path):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_relative_files(entry.path, prefix + entry.name + os.sep)
+        elif entry.is_file():
+            yield prefix + entry.name
+
+
+def _scandir_level(path) -> list[os.DirEntry]:
+    """List one directory's entries, or none if it cannot be read."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except PermissionError:
+        return []
+
+
+def _scan_skill_dir(path: str | Path) -> tuple[set[str], int]:
+    """
+    Return a skill folder's top-level entry names and its recursive entry
+    count (files and directories) from one scandir walk.
+    """
+    names = set()
+    count = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                names.add(entry.name)
+                count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    count += _count_entries(entry.path)
+    except PermissionError:
+        pass
+    return names, count
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy one file with its metadata, in-kernel via copy_file_range where
+    available (which also lets copy-on-write filesystems share extents).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                while os.copy_file_range(fin.fileno(), fout.fileno(), COPY_CHUNK_BYTES):
+                    pass
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # e.g. unsupported filesystem; copy2 below rewrites dst
+    # copy2 already uses sendfile/fcopyfile/CopyFile2 on each platform
+    shutil.copy2(src, dst)
 
-        skill_data = {"name": skill_dir.name}
 
-        # Load metadata from _meta.json
-        meta_file = skill_dir / "_meta.json"
-        if meta_file.exists():
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                skill_data.update(meta)
-            except (json.JSONDecodeError, OSError):
-                pass  # Skip invalid metadata
+def _fast_copytree(src: str, dst: str) -> int:
+    """
+    Recursively copy src to a new directory dst (like shutil.copytree).
 
-        # Load content from SKILL.md
-        skill_file = skill_dir / "SKILL.md"
-        if skill_file.exists():
-            try:
-                content = skill_file.read_text(encoding="utf-8")
-                skill_data["content"] = content
+    Returns the number of files and directories copied below dst.
+    """
+    os.makedirs(dst)
+    with os.scandir(src) as it:
+        entries = list(it)
+    count = len(entries)
+    for entry in entries:
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            count += _fast_copytree(entry.path, target)
+        else:
+            _copy_file(entry.path, target)
+    shutil.copystat(src, dst)
+    return count
 
-                # Extract description if not in metadata
-                if "description" not in skill_data:
-                    desc = extract_description_from_frontmatter(content)
-                    if desc:
-                        skill_data["description"] = desc
-            except OSError:
-                pass
 
-        # Add file structure info
-        skill_data["has_scripts"] = (skill_dir / "scripts").exists()
-        skill_data["has_references"] = (skill_dir / "references").exists()
-        skill_data["file_count"] = len(list(skill_dir.rglob("*")))
+def _count_entries(path) -> int:
+    """Count the files and directories below path."""
+    count = 0
+    for _ in _scandir_recursive(path):
+        count += 1
+    return count
 
-        skills.append(skill_data)
 
-    return skills
+def list_all_skills(include_content: bool = False) -> list[dict[str, Any]]:
+    """List all skills with their metadata."""
+    return list(iter_all_skills(include_content))
+
+
+def iter_all_skills(include_content: bool = False) -> Iterator[dict[str, Any]]:
+    """
+    Yield each skill with its metadata, in directory order.
+
+    SKILL.md bodies are only included with include_content; otherwise
+    SKILL.md is read at all only when _meta.json lacks a description, and
+    then only up to the end of its frontmatter. With many skills, folders
+    are read on a small thread pool (file I/O releases the GIL).
+    """
+    skills_dir = get_skills_dir()
+
+    if not skills_dir.exists():
+        return
+
+    # One listing with cached file types instead of a stat per entry; taken
+    # up front so no directory handle stays open while results stream out
+    with os.scandir(skills_dir) as it:
+        # Plain path strings: no Path object per skill or per file joined below
+        skill_dirs = [
+            entry.path for entry in it
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+
+    if len(skill_dirs) < LIST_PARALLEL_MIN:
+        for skill_dir in skill_dirs:
+            yield _load_skill_summary(skill_dir, include_content)
+    else:
+        yield from _LIST_EXECUTOR.map(
+            _load_skill_summary, skill_dirs, itertools.repeat(include_content)
+        )
+
+
+def _load_skill_summary(skill_dir: str, include_content: bool) -> dict[str, Any]:
+    """Build one iter_all_skills entry from a skill folder path."""
+    skill_data = {"name": os.path.basename(skill_dir)}
+
+    # Load metadata from _meta.json
+    try:
+        skill_data.update(_read_cached(os.path.join(skill_dir, "_meta.json"), _parse_json))
+    except (json.JSONDecodeError, OSError):
+        pass  # Skip missing or invalid metadata
+
+    # Load content from SKILL.md
+    skill_file = os.path.join(skill_dir, "SKILL.md")
+    try:
+        desc = None
+        if include_content:
+            content = _read_cached(skill_file, _decode_text)
+            skill_data["content"] = content
+            if "description" not in skill_data:
+                desc = extract_description_from_frontmatter(content)
+        elif "description" not in skill_data:
+            desc = _read_cached(skill_file, _head_description, read=_read_frontmatter)
+
+        # Extract description if not in metadata
+        if desc:
+            skill_data["description"] = desc
+    except OSError:
+        pass
+
+    # Add file structure info
+    top_level_names, skill_data["file_count"] = _scan_skill_dir(skill_dir)
+    skill_data["has_scripts"] = "scripts" in top_level_names
+    skill_data["has_references"] = "references" in top_level_names
+
+    return skill_data
+
+
+def skills_etag() -> str:
+    """
+    Return a fingerprint of the skills list for HTTP ETag validation.
+
+    Covers the mtime of the skills folder, of each skill folder and of every
+    folder below it (entries added, removed or atomically replaced at any
+    depth, so file_count stays in step) plus each SKILL.md and _meta.json
+    (mtime, size), without reading any file.
+
+    The walk stats about as many entries as building the listing does, so a
+    304 saves the JSON serialization and the response body, not the disk scan.
+    """
+    skills_dir = get_skills_dir()
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        digest.update(str(os.stat(skills_dir).st_mtime_ns).encode())
+        with os.scandir(skills_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if not entry.is_dir() or entry.name.startswith("."):
+                    continue
+                parts = [entry.name, str(entry.stat().st_mtime_ns)]
+                # A nested addition only bumps its own folder's mtime
+                for sub in _scandir_recursive(entry.path):
+                    if sub.is_dir(follow_symlinks=False):
+                        try:
+                            parts.append(str(sub.stat(follow_symlinks=False).st_mtime_ns))
+                        except OSError:
+                            parts.append("-")
+                for name in ("SKILL.md", "_meta.json"):
+                    try:
+                        st = os.stat(os.path.join(entry.path, name))
+                        parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+                    except OSError:
+                        parts.append("-")
+                digest.update("|".join(parts).encode("utf-8", "surrogateescape") + b"\n")
+    except FileNotFoundError:
+        pass
+    return digest.hexdigest()
 
 
 def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
@@ -75,25 +410,19 @@ def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
     skill_data = {"name": name, "files": []}
 
     # Load metadata
-    meta_file = skill_dir / "_meta.json"
-    if meta_file.exists():
-        try:
-            skill_data.update(json.loads(meta_file.read_text(encoding="utf-8")))
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        skill_data.update(_read_cached(skill_dir / "_meta.json", _parse_json))
+    except (json.JSONDecodeError, OSError):
+        pass
 
     # Load content
-    skill_file = skill_dir / "SKILL.md"
-    if skill_file.exists():
-        try:
-            skill_data["content"] = skill_file.read_text(encoding="utf-8")
-        except OSError:
-            pass
+    try:
+        skill_data["content"] = _read_cached(skill_dir / "SKILL.md", _decode_text)
+    except OSError:
+        pass
 
     # List all files
-    for f in skill_dir.rglob("*"):
-        if f.is_file():
-            skill_data["files"].append(str(f.relative_to(skill_dir)))
+    skill_data["files"] = list(_iter_relative_files(skill_dir))
 
     return skill_data, None
 
@@ -126,7 +455,7 @@ def create_skill(
 
     # Write SKILL.md
     skill_md = create_skill_markdown(name, description, content)
-    (skill_dir / "SKILL.md").write_text(skill_md, encoding="utf-8")
+    _atomic_write_text(skill_dir / "SKILL.md", skill_md)
 
     # Write _meta.json
     meta = {
@@ -136,8 +465,9 @@ def create_skill(
         "sub_skills": sub_skills or [],
         "source": "created",
     }
-    (skill_dir / "_meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    _atomic_write_bytes(skill_dir / "_meta.json", _dump_meta(meta))
 
+    _invalidate_skill_cache(skill_dir)
     return {"success": True, "name": name, "path": str(skill_dir)}, None
 
 
@@ -161,23 +491,24 @@ def update_skill(
 
     # Write updated SKILL.md
     skill_md = create_skill_markdown(name, description, content)
-    (skill_dir / "SKILL.md").write_text(skill_md, encoding="utf-8")
+    _atomic_write_text(skill_dir / "SKILL.md", skill_md)
 
-    # Update _meta.json
+    # Update _meta.json, starting from the cached parse when the file is
+    # unchanged (copied: cached values must not be mutated)
     meta_file = skill_dir / "_meta.json"
     meta = {}
-    if meta_file.exists():
-        try:
-            meta = json.loads(meta_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        meta = dict(_read_cached(meta_file, _parse_json))
+    except (json.JSONDecodeError, OSError):
+        pass  # Missing or invalid metadata is rebuilt below
 
     meta.update({
         "name": name,
         "description": description,
         "tags": tags if tags is not None else meta.get("tags", []),
     })
-    meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    _atomic_write_bytes(meta_file, _dump_meta(meta))
+    _invalidate_skill_cache(skill_dir)
 
     return {"success": True, "name": name}, None
 
@@ -195,10 +526,49 @@ def delete_skill(name: str) -> tuple[dict[str, Any] | None, str | None]:
     if not skill_dir.exists():
         return None, f"Skill '{name}' not found"
 
-    shutil.rmtree(skill_dir)
+    _discard_tree(skill_dir)
+    _invalidate_skill_cache(skill_dir)
     return {"success": True, "name": name}, None
 
 
+def _discard_tree(path: Path) -> None:
+    """
+    Remove a folder from the skills directory with one rename into its
+    TRASH_DIR_NAME folder, then delete its files in the background so the
+    request does not wait on rmtree.
+    """
+    trash_dir = path.parent / TRASH_DIR_NAME / f"{path.name}-{uuid.uuid4().hex}"
+    try:
+        os.makedirs(trash_dir.parent, exist_ok=True)
+        os.rename(path, trash_dir)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        _DELETE_EXECUTOR.submit(shutil.rmtree, trash_dir, ignore_errors=True)
+
+
+def purge_trash() -> None:
+    """
+    Delete, in the background, trash folders left behind by an earlier crash.
+
+    Only the skills directory's own TRASH_DIR_NAME and STAGING_DIR_NAME
+    folders are swept. Staging folders younger than STAGING_MAX_AGE are kept,
+    since another running instance may still be writing an import into them.
+    """
+    skills_dir = get_skills_dir()
+    for trash_dir in (skills_dir / TRASH_DIR_NAME).glob("*"):
+        _DELETE_EXECUTOR.submit(shutil.rmtree, trash_dir, ignore_errors=True)
+
+    cutoff = time.time() - STAGING_MAX_AGE
+    for stage in (skills_dir / STAGING_DIR_NAME).glob("*"):
+        try:
+            abandoned = stage.stat().st_mtime < cutoff
+        except OSError:
+            continue
+        if abandoned:
+            _DELETE_EXECUTOR.submit(shutil.rmtree, stage, ignore_errors=True)
+
+
 def import_folder(
     source_path: str,
     new_name: str = "",
@@ -228,25 +598,27 @@ def import_folder(
         return None, f"Skill '{skill_name}' already exists. Use overwrite option."
 
     try:
-        # Copy entire directory
-        shutil.copytree(source, dest)
+        # Copy entire directory, counting entries as they are copied
+        file_count = _fast_copytree(str(source), str(dest))
 
         # Verify SKILL.md exists or create minimal one
         skill_md = dest / "SKILL.md"
+        skill_md_content = None
         if not skill_md.exists():
-            skill_md.write_text(
-                create_skill_markdown(skill_name, "Imported skill", f"# {skill_name}\n\nImported skill."),
-                encoding="utf-8"
+            skill_md_content = create_skill_markdown(
+                skill_name, "Imported skill", f"# {skill_name}\n\nImported skill."
             )
+            _atomic_write_text(skill_md, skill_md_content)
+            file_count += 1
 
         # Create _meta.json if missing
         meta_file = dest / "_meta.json"
         if not meta_file.exists():
-            description = "Imported skill"
-            if skill_md.exists():
-                desc = extract_description_from_frontmatter(skill_md.read_text(encoding="utf-8"))
-                if desc:
-                    description = desc
+            if skill_md_content is None:
+                description = _skill_md_description(skill_md)
+            else:
+                description = extract_description_from_frontmatter(skill_md_content)
+            description = description or "Imported skill"
 
             meta = {
                 "name": skill_name,
@@ -255,9 +627,10 @@ def import_folder(
                 "sub_skills": [],
                 "source": "imported",
             }
-            meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            _atomic_write_bytes(meta_file, _dump_meta(meta))
+            file_count += 1
 
-        file_count = len(list(dest.rglob("*")))
+        _invalidate_skill_cache(dest)
         return {
             "success": True,
             "name": skill_name,
@@ -268,10 +641,90 @@ def import_folder(
     except Exception as e:
         # Cleanup on failure
         if dest.exists():
-            shutil.rmtree(dest)
+            _discard_tree(dest)
         return None, str(e)
 
 
+def _safe_join(base: str, rel: str) -> str | None:
+    """
+    Join a client-supplied relative path onto base (a normalized directory).
+
+    Returns None if the result would not be a path strictly inside base,
+    e.g. for '..' segments or absolute paths.
+    """
+    candidate = os.path.normpath(os.path.join(base, rel.replace("\\", "/")))
+    try:
+        inside = os.path.commonpath([candidate, base]) == base
+    except ValueError:  # Different drives on Windows
+        return None
+    return candidate if inside and candidate != base else None
+
+
+def _streamable_base64(content: str) -> str | None:
+    """
+    Prepare base64 text for _iter_base64_chunks: drop characters outside the
+    alphabet (a2b_base64 skips them anyway, but they would shift the chunks'
+    4-character alignment). Returns None if the text must be decoded whole,
+    because padding before the final quad changes how a2b_base64 reads on.
+    """
+    if _BASE64_NON_ALPHABET_RE.search(content):
+        content = _BASE64_NON_ALPHABET_RE.sub("", content)
+    if content.find("=", 0, len(content) - 2) != -1:
+        return None
+    return content
+
+
+def _iter_base64_chunks(content: str) -> Iterator[bytes]:
+    """Decode base64 text BASE64_CHUNK_CHARS characters at a time."""
+    for start in range(0, len(content), BASE64_CHUNK_CHARS):
+        yield binascii.a2b_base64(content[start:start + BASE64_CHUNK_CHARS])
+
+
+def _write_import_files(stage: str, writes: list[tuple[str, Any]]) -> None:
+    """Write import_files_json entries below a new staging folder."""
+    os.makedirs(stage)
+    # Create each destination folder once rather than once per file
+    for parent in {os.path.dirname(dest_path) for dest_path, _ in writes}:
+        os.makedirs(parent, exist_ok=True)
+
+    # Write concurrently; file I/O releases the GIL
+    if len(writes) > 1:
+        with ThreadPoolExecutor(max_workers=min(IMPORT_MAX_WORKERS, len(writes))) as executor:
+            list(executor.map(_write_import_file, writes))
+    else:
+        for item in writes:
+            _write_import_file(item)
+
+
+def _move_staged_files(stage: str, skill_dir: str, rel_paths: list[str]) -> None:
+    """
+    Move written files from stage into skill_dir: a new skill with one
+    rename, an existing one file by file (each replace is atomic).
+    """
+    try:
+        os.rename(stage, skill_dir)
+        return
+    except OSError:
+        pass  # skill_dir already exists
+
+    for parent in {os.path.dirname(rel) for rel in rel_paths}:
+        os.makedirs(os.path.join(skill_dir, parent), exist_ok=True)
+    for rel in dict.fromkeys(rel_paths):
+        os.replace(os.path.join(stage, rel), os.path.join(skill_dir, rel))
+    _DELETE_EXECUTOR.submit(shutil.rmtree, stage, ignore_errors=True)
+
+
+def _write_import_file(item: tuple[str, str | bytes | Iterator[bytes]]) -> None:
+    """Write one import_files_json entry (text, decoded bytes, or decoded chunks)."""
+    dest_path, content = item
+    if isinstance(content, bytes):
+        _atomic_write_bytes(dest_path, content)
+    elif isinstance(content, str):
+        _atomic_write_text(dest_path, content)
+    else:
+        _atomic_write_chunks(dest_path, content)
+
+
 def import_files_json(
     skill_name: str,
     files: list[dict[str, Any]],
@@ -292,38 +745,68 @@ def import_files_json(
     skill_name = sanitize_name(skill_name)
     skills_dir = get_skills_dir()
     skill_dir = skills_dir / skill_name
-    skill_dir.mkdir(parents=True, exist_ok=True)
 
     imported = []
+    writes = []
+    base = os.path.normpath(str(skill_dir))
+    skill_md_path = os.path.join(base, "SKILL.md")
+    skill_md_content = None
 
     for f in files:
         file_path = f.get("path", "")
-        content = f.get("content", "")
-        is_base64 = f.get("base64", False)
 
-        # Security: prevent path traversal
-        if not file_path or ".." in file_path:
+        # Security: prevent path traversal (plain string joins, no Path objects)
+        dest_path = _safe_join(base, file_path) if file_path else None
+        if dest_path is None:
             continue
 
-        dest_path = skill_dir / file_path.replace("\\", "/")
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if is_base64:
-            dest_path.write_bytes(base64.b64decode(content))
-        else:
-            dest_path.write_text(content, encoding="utf-8")
-
+        content = f.get("content", "")
+        if f.get("base64", False):
+            streamable = _streamable_base64(content) if len(content) > BASE64_STREAM_MIN else None
+            if streamable is not None:
+                # Large upload: decode while writing so the decoded copy never
+                # sits in memory whole
+                content = _iter_base64_chunks(streamable)
+            else:
+                # Decode up front so a malformed payload fails before anything is written
+                try:
+                    content = binascii.a2b_base64(content)
+                except (binascii.Error, ValueError):
+                    return None, f"Invalid base64 content: {file_path}"
+        elif dest_path == skill_md_path:
+            # Keep the uploaded text so _meta.json needs no read-back
+            skill_md_content = content
+
+        writes.append((os.path.relpath(dest_path, base), content))
         imported.append(file_path)
 
+    # Write into a staging folder inside the skills directory and move the
+    # files into the skill only once all of them are written, so a failure
+    # (e.g. a streamed base64 payload that turns out to be malformed) leaves
+    # the skill untouched. purge_trash sweeps abandoned ones after a crash.
+    stage = str(skills_dir / STAGING_DIR_NAME / f"import-{uuid.uuid4().hex}")
+    staged = [(os.path.join(stage, rel), content) for rel, content in writes]
+    try:
+        _write_import_files(stage, staged)
+    except (binascii.Error, ValueError):
+        # Only streamed (large) base64 payloads can fail this late
+        _DELETE_EXECUTOR.submit(shutil.rmtree, stage, ignore_errors=True)
+        return None, "Invalid base64 content"
+    except BaseException:
+        _DELETE_EXECUTOR.submit(shutil.rmtree, stage, ignore_errors=True)
+        raise
+    _move_staged_files(stage, base, [rel for rel, _ in writes])
+
     # Create _meta.json if missing
     meta_file = skill_dir / "_meta.json"
     if not meta_file.exists():
-        description = "Imported skill"
-        skill_md = skill_dir / "SKILL.md"
-        if skill_md.exists():
-            desc = extract_description_from_frontmatter(skill_md.read_text(encoding="utf-8"))
-            if desc:
-                description = desc
+        if skill_md_content is not None:
+            description = extract_description_from_frontmatter(skill_md_content)
+        elif os.path.exists(skill_md_path):
+            description = _skill_md_description(skill_md_path)
+        else:
+            description = None
+        description = description or "Imported skill"
 
         meta = {
             "name": skill_name,
@@ -332,6 +815,7 @@ def import_files_json(
             "sub_skills": [],
             "source": "json-upload",
         }
-        meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        _atomic_write_bytes(meta_file, _dump_meta(meta))
 
+    _invalidate_skill_cache(skill_dir)
     return {"success": True, "name": skill_name, "files_imported": imported}, None
@@ -0,0 +1,39 @@
+# core/static.py
+# In-memory serving of the single-page web UI
+
+import hashlib
+import os
+
+from flask import Response, abort, request
+
+# Served pages: path -> ((mtime_ns, size), body, etag)
+_PAGE_CACHE: dict[str, tuple[tuple[int, int], bytes, str]] = {}
+
+
+def send_cached_page(directory: str, filename: str, max_age: int) -> Response:
+    """
+    Serve an HTML file from memory, re-reading it only when its mtime or size
+    changes. Like send_from_directory, sets ETag/Last-Modified and answers
+    matching conditional requests with 304.
+    """
+    path = os.path.join(directory, filename)
+    try:
+        st = os.stat(path)
+    except OSError:
+        abort(404)
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _PAGE_CACHE.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, "rb") as f:
+            body = f.read()
+        cached = (signature, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        _PAGE_CACHE[path] = cached
+
+    _, body, etag = cached
+    response = Response(body, mimetype="text/html")
+    response.set_etag(etag)
+    response.last_modified = st.st_mtime
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
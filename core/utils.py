@@ -2,14 +2,33 @@
 # Shared utility functions
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Frontmatter text between the leading '---' and the next '---'
+_FRONTMATTER_RE = re.compile(r'---(.*?)---', re.S)
+_DESCRIPTION_RE = re.compile(r'^[ \t]*description[ \t]*:(.*)$', re.M)
+_NAME_OR_DESCRIPTION_RE = re.compile(r'^(name|description):(.*)$', re.M)
+_FRONTMATTER_LINE_RE = re.compile(r'^([^:\n]*):(.*)$', re.M)
+_UNSAFE_NAME_RE = re.compile(r'[^a-z0-9-]')
 
+# Every ASCII character outside [a-z0-9-] becomes '-'
+_SANITIZE_TABLE = str.maketrans({
+    chr(cp): '-' for cp in range(128)
+    if not ('a' <= chr(cp) <= 'z' or '0' <= chr(cp) <= '9' or chr(cp) == '-')
+})
+
+
+@lru_cache(maxsize=1024)
 def sanitize_name(name: str) -> str:
-    """Convert name to valid skill directory name."""
+    """Convert name to valid skill directory name (memoized; names repeat across requests)."""
     if not name:
         return ""
-    return re.sub(r'[^a-z0-9-]', '-', name.lower().strip()).strip('-')
+    name = name.lower().strip()
+    if name.isascii():
+        return name.translate(_SANITIZE_TABLE).strip('-')
+    # The table only covers ASCII; anything else still goes through the regex
+    return _UNSAFE_NAME_RE.sub('-', name).strip('-')
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -27,11 +46,11 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         frontmatter_text = content[3:end_index].strip()
         body = content[end_index + 3:].strip()
 
-        frontmatter = {}
-        for line in frontmatter_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                frontmatter[key.strip()] = value.strip()
+        # One scan over the lines that contain a colon; later keys win
+        frontmatter = {
+            key.strip(): value.strip()
+            for key, value in _FRONTMATTER_LINE_RE.findall(frontmatter_text)
+        }
 
         return frontmatter, body
     except ValueError:
@@ -40,16 +59,25 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
 def extract_description_from_frontmatter(content: str) -> Optional[str]:
     """Extract description field from markdown frontmatter."""
-    frontmatter, _ = parse_frontmatter(content)
-    return frontmatter.get('description')
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None
+    # Like parse_frontmatter, a repeated key keeps its last value
+    descriptions = _DESCRIPTION_RE.findall(match.group(1))
+    return descriptions[-1].strip() if descriptions else None
+
+
+def extract_name_and_description(content: str) -> dict[str, str]:
+    """Extract name and description lines from markdown frontmatter."""
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return {}
+    return {key: value.strip() for key, value in _NAME_OR_DESCRIPTION_RE.findall(match.group(1))}
+
+
+_SKILL_MD_TEMPLATE = "---\nname: {name}\ndescription: {description}\n---\n\n{content}\n"
 
 
 def create_skill_markdown(name: str, description: str, content: str) -> str:
     """Create a properly formatted SKILL.md file content."""
-    return f"""---
-name: {name}
-description: {description}
----
-
-{content}
-"""
+    return _SKILL_MD_TEMPLATE.format_map({"name": name, "description": description, "content": content})
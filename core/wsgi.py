@@ -0,0 +1,25 @@
+# core/wsgi.py
+# Production WSGI serving for the Flask apps
+
+import os
+
+try:
+    from waitress import serve as _waitress_serve
+except ImportError:
+    _waitress_serve = None
+
+# Worker threads per process; each long-running Claude CLI call holds one
+WSGI_THREADS = int(os.environ.get("SKILLS_WSGI_THREADS", "16"))
+
+
+def serve(app, host: str, port: int) -> None:
+    """
+    Serve app with waitress when it is installed, else Flask's threaded server.
+
+    For several worker processes on POSIX, run gunicorn against the module
+    instead, e.g. `gunicorn -w 4 --threads 8 -b :5050 skills_manager_api:app`.
+    """
+    if _waitress_serve is not None:
+        _waitress_serve(app, host=host, port=port, threads=WSGI_THREADS)
+    else:
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
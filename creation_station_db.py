@@ -6,7 +6,7 @@ from pathlib import Path
 import base64
 import os
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Iterator
 
 DEFAULT_DB_PATH = Path(__file__).parent / "creation_station.db"
 
@@ -21,9 +21,24 @@ def get_db_path() -> Path:
     ).resolve()
 
 
+# Per-connection settings; journal_mode=WAL is persistent and set in init_db
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA busy_timeout = 5000;
+PRAGMA cache_size = -20000;
+PRAGMA temp_store = MEMORY;
+PRAGMA foreign_keys = ON;
+"""
+
+
 def connect(db_path: Path | None = None) -> sqlite3.Connection:
-    connection = sqlite3.connect(str(db_path or get_db_path()))
+    # IMMEDIATE: a writing transaction takes the write lock at BEGIN instead of
+    # upgrading from a read lock mid-transaction, which can fail with SQLITE_BUSY
+    connection = sqlite3.connect(
+        str(db_path or get_db_path()), isolation_level="IMMEDIATE"
+    )
     connection.row_factory = sqlite3.Row
+    connection.executescript(CONNECTION_PRAGMAS)
     return connection
 
 
@@ -31,6 +46,8 @@ def init_db(db_path: Path | None = None) -> None:
     db_path = db_path or get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
     with connect(db_path) as conn:
+        # Readers no longer block on (or block) writers
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS skills (
@@ -113,6 +130,18 @@ def init_db(db_path: Path | None = None) -> None:
                 linked_skill_name TEXT,
                 linked_skill_version_id INTEGER
             );
+
+            -- Newest-first listings read the index instead of sorting the table
+            CREATE INDEX IF NOT EXISTS idx_runs_created_at
+                ON runs(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_feedback_run_created_at
+                ON feedback(run_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_run_outputs_run_id
+                ON run_outputs(run_id);
+            CREATE INDEX IF NOT EXISTS idx_skill_versions_skill_version
+                ON skill_versions(skill_id, version_number);
+            CREATE INDEX IF NOT EXISTS idx_skill_files_version_path
+                ON skill_files(skill_version_id, path);
             """
         )
 
@@ -124,13 +153,25 @@ class SkillFile:
     is_binary: bool
 
 
+TEXT_SUFFIXES = {".md", ".json", ".txt"}
+
+
+def _iter_skill_files(directory: str, prefix: str = "") -> Iterator[tuple[str, Path]]:
+    # scandir reports entry types from the listing itself, so no stat() per
+    # path as with rglob + is_file; symlinked directories are not followed
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            rel_path = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_skill_files(entry.path, rel_path + "/")
+            elif entry.is_file():
+                yield rel_path, Path(entry.path)
+
+
 def load_skill_files(skill_dir: Path) -> list[SkillFile]:
     files: list[SkillFile] = []
-    for file_path in skill_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        rel_path = str(file_path.relative_to(skill_dir)).replace("\\", "/")
-        if file_path.suffix.lower() in {".md", ".json", ".txt"}:
+    for rel_path, file_path in _iter_skill_files(str(skill_dir)):
+        if file_path.suffix.lower() in TEXT_SUFFIXES:
             files.append(
                 SkillFile(
                     path=rel_path,
@@ -149,9 +190,9 @@ def load_skill_files(skill_dir: Path) -> list[SkillFile]:
     return files
 
 
-def upsert_skill(conn: sqlite3.Connection, name: str) -> int:
+def upsert_skill(conn: sqlite3.Connection, name: str, now: str | None = None) -> int:
     row = conn.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()
-    now = utc_now()
+    now = now or utc_now()
     if row:
         conn.execute(
             "UPDATE skills SET updated_at = ? WHERE id = ?", (now, row["id"])
@@ -180,9 +221,10 @@ def create_version(
     status: str,
     summary: str | None = None,
     published: bool = False,
+    now: str | None = None,
 ) -> int:
     version_number = next_version_number(conn, skill_id)
-    created_at = utc_now()
+    created_at = now or utc_now()
     published_at = created_at if published else None
     cursor = conn.execute(
         """
@@ -194,6 +236,8 @@ def create_version(
         (skill_id, version_number, status, summary, created_at, published_at),
     )
     version_id = int(cursor.lastrowid)
+    text_rows = []
+    binary_rows = []
     for skill_file in files:
         if skill_file.is_binary:
             content_blob = (
@@ -201,32 +245,37 @@ def create_version(
                 if isinstance(skill_file.content, bytes)
                 else base64.b64decode(skill_file.content)
             )
-            conn.execute(
-                """
-                INSERT INTO skill_files (
-                    skill_version_id, path, content_blob, is_binary, encoding, created_at
-                )
-                VALUES (?, ?, ?, 1, 'base64', ?)
-                """,
-                (version_id, skill_file.path, content_blob, created_at),
-            )
+            binary_rows.append((version_id, skill_file.path, content_blob, created_at))
         else:
-            conn.execute(
-                """
-                INSERT INTO skill_files (
-                    skill_version_id, path, content_text, is_binary, encoding, created_at
-                )
-                VALUES (?, ?, ?, 0, 'utf-8', ?)
-                """,
-                (version_id, skill_file.path, str(skill_file.content), created_at),
+            text_rows.append((version_id, skill_file.path, str(skill_file.content), created_at))
+    # One prepared statement per kind instead of one execute per file
+    if binary_rows:
+        conn.executemany(
+            """
+            INSERT INTO skill_files (
+                skill_version_id, path, content_blob, is_binary, encoding, created_at
             )
+            VALUES (?, ?, ?, 1, 'base64', ?)
+            """,
+            binary_rows,
+        )
+    if text_rows:
+        conn.executemany(
+            """
+            INSERT INTO skill_files (
+                skill_version_id, path, content_text, is_binary, encoding, created_at
+            )
+            VALUES (?, ?, ?, 0, 'utf-8', ?)
+            """,
+            text_rows,
+        )
     return version_id
 
 
 def publish_version(
-    conn: sqlite3.Connection, skill_id: int, version_id: int
+    conn: sqlite3.Connection, skill_id: int, version_id: int, now: str | None = None
 ) -> None:
-    published_at = utc_now()
+    published_at = now or utc_now()
     conn.execute(
         "UPDATE skill_versions SET status = ?, published_at = ? WHERE id = ?",
         ("published", published_at, version_id),
@@ -274,11 +323,12 @@ def decode_skill_file(row: sqlite3.Row) -> SkillFile:
 
 
 def seed_skills_from_filesystem(skills_dir: Path, db_path: Path | None = None) -> None:
+    now = utc_now()  # One timestamp for the whole seeding transaction
     with connect(db_path) as conn:
         for skill_dir in skills_dir.iterdir():
-            if not skill_dir.is_dir():
+            if not skill_dir.is_dir() or skill_dir.name.startswith("."):
                 continue
-            skill_id = upsert_skill(conn, skill_dir.name)
+            skill_id = upsert_skill(conn, skill_dir.name, now)
             existing = conn.execute(
                 "SELECT COUNT(*) AS count FROM skill_versions WHERE skill_id = ?",
                 (skill_id,),
@@ -293,8 +343,9 @@ def seed_skills_from_filesystem(skills_dir: Path, db_path: Path | None = None) -
                 status="published",
                 summary="Seeded from filesystem",
                 published=True,
+                now=now,
             )
-            publish_version(conn, skill_id, version_id)
+            publish_version(conn, skill_id, version_id, now)
 
 
 def write_version_to_filesystem(
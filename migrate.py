@@ -16,15 +16,35 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import shutil
 import zipfile
 from pathlib import Path
 
+# Optional: faster JSON encoding/decoding (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_parse_json = orjson.loads if orjson is not None else json.loads
+
 
 SKILLS_DIR = Path(__file__).parent / "skills"
 
 
+def write_meta_json(meta_path: Path, meta: dict) -> None:
+    """Write _meta.json via a temporary file and os.replace, so it is never half-written."""
+    if orjson is not None:
+        data = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(meta, indent=2).encode("utf-8")
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, meta_path)
+
+
 def extract_metadata_from_skill_md(content: str, skill_name: str) -> dict:
     """Extract metadata from SKILL.md content."""
     meta = {
@@ -236,8 +256,7 @@ def migrate_skill_folder(source_dir: Path, skill_name: str = None) -> Path:
     meta = extract_metadata_from_skill_md(skill_content, skill_name)
     meta["sub_skills"] = find_references(target_dir)
 
-    meta_path = target_dir / "_meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    write_meta_json(target_dir / "_meta.json", meta)
     print(f"  Generated _meta.json with {len(meta['sub_skills'])} sub-skills")
 
     return target_dir
@@ -278,8 +297,7 @@ def migrate_single_skill_md(skill_md_path: Path, skill_name: str) -> Path:
     meta = extract_metadata_from_skill_md(skill_content, skill_name)
     meta["sub_skills"] = find_references(target_dir)
 
-    meta_path = target_dir / "_meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    write_meta_json(target_dir / "_meta.json", meta)
 
     return target_dir
 
@@ -298,7 +316,7 @@ def main():
             if skill_dir.is_dir():
                 meta_file = skill_dir / "_meta.json"
                 if meta_file.exists():
-                    meta = json.loads(meta_file.read_text())
+                    meta = _parse_json(meta_file.read_bytes())
                     sub_count = len(meta.get("sub_skills", []))
                     print(f"  {skill_dir.name}: {sub_count} sub-skills")
         return
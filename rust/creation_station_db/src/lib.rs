@@ -125,6 +125,17 @@ pub fn init_db(db_path: &Path) -> Result<()> {
             linked_skill_name TEXT,
             linked_skill_version_id INTEGER
         );
+
+        CREATE INDEX IF NOT EXISTS idx_runs_created_at
+            ON runs(created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_feedback_run_created_at
+            ON feedback(run_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_run_outputs_run_id
+            ON run_outputs(run_id);
+        CREATE INDEX IF NOT EXISTS idx_skill_versions_skill_version
+            ON skill_versions(skill_id, version_number);
+        CREATE INDEX IF NOT EXISTS idx_skill_files_version_path
+            ON skill_files(skill_version_id, path);
         "#,
     )?;
     Ok(())
@@ -2,12 +2,32 @@
 from fastmcp import FastMCP
 from pathlib import Path
 from datetime import datetime
-from threading import Thread, Lock
+from threading import Thread, Lock, Event
+import asyncio
 import json
+import os
 import re
 import time
 import logging
-from collections import deque
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import count, islice
+
+# Optional: faster JSON parsing (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: OS-level change notifications (inotify/FSEvents/ReadDirectoryChangesW)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +39,10 @@ logger = logging.getLogger("skills-server")
 mcp = FastMCP("skills-server")
 SKILLS_DIR = Path(__file__).parent / "skills"
 
+# Set SKILLS_WATCH=0 to disable the file watcher (e.g. for a read-only skills
+# mount); call the reload_index tool to pick up changes on demand instead.
+WATCH_ENABLED = os.environ.get("SKILLS_WATCH", "1") != "0"
+
 # Ensure skills directory exists
 if not SKILLS_DIR.exists():
     logger.warning(f"Skills directory not found, creating: {SKILLS_DIR}")
@@ -26,10 +50,18 @@ if not SKILLS_DIR.exists():
 
 _INDEX = None
 _CONTENT_INDEX = None  # Full-text search index
-_FILE_MTIMES = {}  # For file watching
+_CONTENT_FILES = []  # File id -> content index entry (ids are positions in _CONTENT_INDEX order)
+_CONTENT_POSTINGS = {}  # Inverted index: token -> bitmask of file ids containing it
+_CONTENT_GENERATION = 0  # Generation of the index _CONTENT_INDEX was built with
+_INDEX_GENERATIONS = count(1)  # Each load_index() gets a new generation number
+_CONTENT_CACHE = {}  # path -> ((mtime_ns, size), raw bytes, lowercased UTF-8 content, tokens); guarded by _CONTENT_INDEX_LOCK
+_FILE_MTIMES = {}  # For polling file watcher (fallback when watchdog is unavailable)
+_RELOAD_EVENT = Event()  # Set by the watchdog handler when skill files change
+_CHANGED_SKILLS = set()  # Skill directory names with pending watchdog events
+WATCH_DEBOUNCE_SECONDS = 0.2  # Coalesce bursts of file events into one reload
 _USAGE_STATS = {
-    "tool_calls": {},
-    "skill_loads": {},
+    "tool_calls": Counter(),
+    "skill_loads": Counter(),
     "searches": deque(maxlen=100),  # Use deque for efficient size limiting
     "start_time": datetime.now().isoformat()
 }
@@ -39,6 +71,48 @@ _INDEX_LOCK = Lock()
 _CONTENT_INDEX_LOCK = Lock()
 _FILE_MTIMES_LOCK = Lock()
 _STATS_LOCK = Lock()
+_CHANGED_SKILLS_LOCK = Lock()
+
+TOKEN_PATTERN = re.compile(r"\w+")
+SAFE_NAME_PATTERN = re.compile(r"[a-zA-Z0-9\-_]+")
+SEARCH_CACHE_SIZE = 256
+LARGE_FILE_BYTES = 64 * 1024  # Larger files are memory-mapped for indexing and not kept raw
+BATCH_MAX_WORKERS = 8
+
+
+class LRUCache:
+    """Small thread-safe LRU cache."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Search results keyed by (kind, index generation, query_lower, limit), so
+# entries computed against an older index can never be served after a reload
+_SEARCH_CACHE = LRUCache(SEARCH_CACHE_SIZE)
+
+# Shared pool for get_skills_batch so each batch doesn't spawn its own threads
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix="skills-batch")
 
 # Schema for _meta.json validation
 META_SCHEMA = {
@@ -56,15 +130,20 @@ def is_safe_skill_name(name: str) -> bool:
     if not name or not isinstance(name, str):
         return False
     # Only allow alphanumeric, hyphens, and underscores
-    return bool(re.match(r'^[a-zA-Z0-9\-_]+$', name))
+    return SAFE_NAME_PATTERN.fullmatch(name) is not None
+
+
+@lru_cache(maxsize=4)
+def resolved_skills_dir(skills_dir: Path) -> Path:
+    """Resolve the skills directory once rather than on every validation."""
+    return skills_dir.resolve()
 
 
 def validate_skill_path(skill_path: Path) -> bool:
     """Validate that a resolved path is within SKILLS_DIR."""
     try:
-        resolved_path = skill_path.resolve()
-        skills_dir_resolved = SKILLS_DIR.resolve()
-        return str(resolved_path).startswith(str(skills_dir_resolved))
+        # is_relative_to compares path parts, so "skills2" is not inside "skills"
+        return skill_path.resolve().is_relative_to(resolved_skills_dir(SKILLS_DIR))
     except (OSError, ValueError):
         return False
 
@@ -98,105 +177,410 @@ def validate_meta(meta: dict, skill_name: str) -> list[str]:
     return errors
 
 
+def iter_skill_dirs():
+    """Yield a DirEntry for each skill directory in SKILLS_DIR (hidden folders such as .trash are skipped)."""
+    with os.scandir(SKILLS_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith("."):
+                yield entry
+
+
+def walk_files(top: str):
+    """Recursively yield a DirEntry for each file below top (symlinked dirs are not followed)."""
+    pending = [top]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+
+
+def scan_markdown_files(directory: str) -> list:
+    """Return DirEntry objects for the *.md files directly inside directory."""
+    try:
+        with os.scandir(directory) as entries:
+            return [e for e in entries if e.name.endswith(".md") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def read_json_file(path) -> dict:
+    """Parse a JSON file from its raw bytes, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception either way.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_file_bytes(path: str) -> bytes:
+    """Read a file's raw bytes."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def decode_text(raw, errors: str = "strict") -> str:
+    """Decode UTF-8 file bytes (or an mmap) the way Path.read_text does (universal newlines)."""
+    return str(raw, "utf-8", errors).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_indexed_content(path: str, stat: os.stat_result, seen: set) -> tuple[bytes | None, bytes, frozenset]:
+    """Return a file's raw bytes, lowercased UTF-8 content and tokens, reusing the cache if unchanged.
+
+    Content is lowercased as str (so non-ASCII letters fold correctly) and then
+    stored as UTF-8 bytes, which is compact and searchable with bytes.find. The
+    raw bytes are kept so get_skill/get_sub_skill can serve files without
+    re-reading them, except for files over LARGE_FILE_BYTES: those are decoded
+    straight from a memory map and raw is None, so they are read from disk
+    when served.
+    """
+    seen.add(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONTENT_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2], cached[3]
+
+    if stat.st_size > LARGE_FILE_BYTES:
+        # The map is closed right away so the file stays deletable on Windows
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = decode_text(mapped, errors="ignore").lower()
+        raw = None
+    else:
+        raw = read_file_bytes(path)
+        text = decode_text(raw, errors="ignore").lower()
+    content = text.encode("utf-8")
+    tokens = frozenset(TOKEN_PATTERN.findall(text))
+    _CONTENT_CACHE[path] = (signature, raw, content, tokens)
+    return raw, content, tokens
+
+
+def cached_file_text(domain: str, rel_path: str, path: Path) -> str | None:
+    """Return an indexed file's original text, or None if it isn't in the content index.
+
+    The file is stat'ed first and the cached copy is only used while its
+    (mtime_ns, size) signature still matches, so edits are never served stale
+    when the watcher is disabled or hasn't reindexed yet.
+    """
+    with _CONTENT_INDEX_LOCK:
+        entry = (_CONTENT_INDEX or {}).get(f"{domain}:{rel_path}")
+    if entry is None or entry["raw"] is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if (stat.st_mtime_ns, stat.st_size) != entry["signature"]:
+        return None
+    return decode_text(entry["raw"])
+
+
+def add_search_fields(meta: dict) -> None:
+    """Precompute the lowercased fields _search_skills compares against."""
+    meta["_name_lc"] = str(meta.get("name", "")).lower()
+    meta["_desc_lc"] = str(meta.get("description", "")).lower()
+    tags = meta.get("tags", [])
+    meta["_tags_lc"] = [str(t).lower() for t in tags] if isinstance(tags, list) else []
+
+    sub_skills = meta.get("sub_skills", [])
+    for sub in sub_skills if isinstance(sub_skills, list) else []:
+        if isinstance(sub, dict):
+            sub["_name_lc"] = str(sub.get("name", "")).lower()
+            sub["_triggers_lc"] = [str(t).lower() for t in sub.get("triggers", [])]
+
+
+def index_sub_skills(meta: dict) -> None:
+    """Map sub-skill names to their entries for O(1) lookups (first entry wins)."""
+    by_name = {}
+    sub_skills = meta.get("sub_skills", [])
+    for sub in sub_skills if isinstance(sub_skills, list) else []:
+        if isinstance(sub, dict):
+            by_name.setdefault(sub.get("name"), sub)
+    meta["_sub_by_name"] = by_name
+
+
+def index_skill_content(skill_name: str, skill_path: str, seen: set) -> dict:
+    """Build the content index entries for one skill directory.
+
+    Callers must hold _CONTENT_INDEX_LOCK, which also guards _CONTENT_CACHE.
+    """
+    index = {}
+
+    # Index SKILL.md
+    skill_file = os.path.join(skill_path, "SKILL.md")
+    try:
+        stat = os.stat(skill_file)
+        raw, content, tokens = read_indexed_content(skill_file, stat, seen)
+        index[f"{skill_name}:SKILL.md"] = {
+            "domain": skill_name,
+            "sub_skill": None,
+            "file": "SKILL.md",
+            "raw": raw,
+            "signature": (stat.st_mtime_ns, stat.st_size),
+            "content": content,
+            "tokens": tokens
+        }
+    except FileNotFoundError:
+        pass
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Failed to read {skill_file}: {e}")
+
+    # Index references
+    for ref_file in scan_markdown_files(os.path.join(skill_path, "references")):
+        try:
+            stat = ref_file.stat()
+            raw, content, tokens = read_indexed_content(ref_file.path, stat, seen)
+            index[f"{skill_name}:references/{ref_file.name}"] = {
+                "domain": skill_name,
+                "sub_skill": ref_file.name[:-3],
+                "file": f"references/{ref_file.name}",
+                "raw": raw,
+                "signature": (stat.st_mtime_ns, stat.st_size),
+                "content": content,
+                "tokens": tokens
+            }
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read {ref_file.path}: {e}")
+
+    # Index scripts
+    for script_file in scan_markdown_files(os.path.join(skill_path, "scripts")):
+        try:
+            stat = script_file.stat()
+            raw, content, tokens = read_indexed_content(script_file.path, stat, seen)
+            index[f"{skill_name}:scripts/{script_file.name}"] = {
+                "domain": skill_name,
+                "sub_skill": script_file.name[:-3].replace('.js', '').replace('.ts', ''),
+                "file": f"scripts/{script_file.name}",
+                "raw": raw,
+                "signature": (stat.st_mtime_ns, stat.st_size),
+                "content": content,
+                "tokens": tokens
+            }
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read {script_file.path}: {e}")
+
+    return index
+
+
 def build_content_index() -> dict:
-    """Build full-text search index from skill content."""
+    """Build full-text search index from skill content.
+
+    Callers must hold _CONTENT_INDEX_LOCK, which also guards _CONTENT_CACHE.
+    """
     index = {}
+    seen = set()
 
     if not SKILLS_DIR.exists():
         logger.warning(f"Skills directory does not exist: {SKILLS_DIR}")
+        _CONTENT_CACHE.clear()
         return index
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir():
-            continue
+    for skill_entry in iter_skill_dirs():
+        index.update(index_skill_content(skill_entry.name, skill_entry.path, seen))
 
-        skill_name = skill_dir.name
-
-        # Index SKILL.md
-        skill_file = skill_dir / "SKILL.md"
-        if skill_file.exists():
-            try:
-                content = skill_file.read_text(encoding="utf-8", errors="ignore").lower()
-                index[f"{skill_name}:SKILL.md"] = {
-                    "domain": skill_name,
-                    "sub_skill": None,
-                    "file": "SKILL.md",
-                    "content": content
-                }
-            except (OSError, UnicodeDecodeError) as e:
-                logger.warning(f"Failed to read {skill_file}: {e}")
+    # Evict files that no longer exist
+    for path in _CONTENT_CACHE.keys() - seen:
+        del _CONTENT_CACHE[path]
 
-        # Index references
-        refs_dir = skill_dir / "references"
-        if refs_dir.exists():
-            for ref_file in refs_dir.glob("*.md"):
-                try:
-                    content = ref_file.read_text(encoding="utf-8", errors="ignore").lower()
-                    index[f"{skill_name}:references/{ref_file.name}"] = {
-                        "domain": skill_name,
-                        "sub_skill": ref_file.stem,
-                        "file": f"references/{ref_file.name}",
-                        "content": content
-                    }
-                except (OSError, UnicodeDecodeError) as e:
-                    logger.warning(f"Failed to read {ref_file}: {e}")
-
-        # Index scripts
-        scripts_dir = skill_dir / "scripts"
-        if scripts_dir.exists():
-            for script_file in scripts_dir.glob("*.md"):
-                try:
-                    content = script_file.read_text(encoding="utf-8", errors="ignore").lower()
-                    index[f"{skill_name}:scripts/{script_file.name}"] = {
-                        "domain": skill_name,
-                        "sub_skill": script_file.stem.replace('.js', '').replace('.ts', ''),
-                        "file": f"scripts/{script_file.name}",
-                        "content": content
-                    }
-                except (OSError, UnicodeDecodeError) as e:
-                    logger.warning(f"Failed to read {script_file}: {e}")
+    return index
+
+
+def build_postings(content_index: dict) -> dict:
+    """Build an inverted index mapping each token to a bitmask of file ids.
+
+    File ids are positions in content_index's iteration order; bit i of a
+    token's mask is set when file i contains the token. Masks are plain ints,
+    so unions and intersections are single C-level | and & operations.
+    """
+    file_ids = defaultdict(list)
+    for file_id, entry in enumerate(content_index.values()):
+        for token in entry["tokens"]:
+            file_ids[token].append(file_id)
+
+    mask_bytes = (len(content_index) + 7) // 8
+    postings = {}
+    for token, ids in file_ids.items():
+        bits = bytearray(mask_bytes)
+        for file_id in ids:
+            bits[file_id >> 3] |= 1 << (file_id & 7)
+        postings[token] = int.from_bytes(bits, "little")
+    return postings
+
+
+def iter_file_ids(mask: int):
+    """Yield the file ids set in a postings bitmask, in ascending order."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def files_containing(word: str, files: list, postings: dict) -> int:
+    """Return a bitmask of indexed files whose content contains word as a substring."""
+    if not TOKEN_PATTERN.fullmatch(word):
+        # Spans non-word characters, so it can't be resolved from tokens
+        word_bytes = word.encode("utf-8")
+        return sum(1 << file_id for file_id, entry in enumerate(files) if word_bytes in entry["content"])
+
+    # Any occurrence of a word-character run lies inside some token
+    mask = 0
+    for token, token_mask in postings.items():
+        if word in token:
+            mask |= token_mask
+    return mask
+
+
+def load_skill(skill_name: str, skill_path: str) -> dict:
+    """Parse and validate one skill's _meta.json into its per_skill record.
+
+    The record holds the parsed meta (None if missing or unreadable) plus the
+    validate_skills findings that only depend on _meta.json.
+    """
+    meta_file = os.path.join(skill_path, "_meta.json")
+    try:
+        meta = read_json_file(meta_file)
+    except FileNotFoundError:
+        return {
+            "meta": None,
+            "has_meta": False,
+            "errors": [f"{skill_name}: Missing _meta.json"],
+            "warnings": [],
+        }
+    except json.JSONDecodeError as e:
+        error = f"{skill_name}: Invalid JSON in _meta.json: {e}"
+        logger.error(error)
+        return {"meta": None, "has_meta": True, "errors": [error], "warnings": []}
+    except (OSError, UnicodeDecodeError) as e:
+        error = f"{skill_name}: Failed to read _meta.json: {e}"
+        logger.error(error)
+        return {"meta": None, "has_meta": True, "errors": [error], "warnings": []}
 
+    # Validate schema
+    errors = validate_meta(meta, skill_name)
+    if errors:
+        logger.warning(f"Validation errors in {skill_name}: {errors}")
+
+    # Warnings for potential issues
+    warnings = []
+    if not meta.get("tags"):
+        warnings.append(f"{skill_name}: No tags defined")
+
+    if not meta.get("sub_skills"):
+        warnings.append(f"{skill_name}: No sub-skills defined (standalone skill)")
+
+    add_search_fields(meta)
+    index_sub_skills(meta)
+    return {
+        "meta": meta,
+        "has_meta": True,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def assemble_index(per_skill: dict) -> dict:
+    """Build a new index generation from per-skill records (skill dir name -> record)."""
+    index = {
+        "skills": [],
+        "validation_errors": [],
+        "per_skill": per_skill,
+        "by_name": {},  # skill name -> meta, for O(1) lookups
+        "generation": next(_INDEX_GENERATIONS),
+    }
+    for record in per_skill.values():
+        # A missing _meta.json is reported by validate_skills, not as a load error
+        if record["has_meta"]:
+            index["validation_errors"].extend(record["errors"])
+        meta = record["meta"]
+        if meta is not None:
+            index["skills"].append(meta)
+            index["by_name"].setdefault(meta.get("name"), meta)
     return index
 
 
-def load_index() -> dict:
-    """Load or rebuild skill index from _meta.json files."""
-    global _CONTENT_INDEX
+def set_content_index(content_index: dict, generation: int) -> None:
+    """Publish a content index and its postings. Callers must hold _CONTENT_INDEX_LOCK."""
+    global _CONTENT_INDEX, _CONTENT_FILES, _CONTENT_POSTINGS, _CONTENT_GENERATION
+    _CONTENT_INDEX = content_index
+    _CONTENT_FILES = list(content_index.values())
+    _CONTENT_POSTINGS = build_postings(content_index)
+    _CONTENT_GENERATION = generation
 
-    index = {"skills": [], "validation_errors": []}
 
+def load_index() -> dict:
+    """Load or rebuild skill index from _meta.json files."""
     if not SKILLS_DIR.exists():
         logger.error(f"Skills directory does not exist: {SKILLS_DIR}")
-        return index
+        return assemble_index({})
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if skill_dir.is_dir():
-            meta_file = skill_dir / "_meta.json"
-            if meta_file.exists():
-                try:
-                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
-
-                    # Validate schema
-                    errors = validate_meta(meta, skill_dir.name)
-                    if errors:
-                        index["validation_errors"].extend(errors)
-                        logger.warning(f"Validation errors in {skill_dir.name}: {errors}")
-
-                    index["skills"].append(meta)
-                except json.JSONDecodeError as e:
-                    error = f"{skill_dir.name}: Invalid JSON in _meta.json: {e}"
-                    index["validation_errors"].append(error)
-                    logger.error(error)
-                except (OSError, UnicodeDecodeError) as e:
-                    error = f"{skill_dir.name}: Failed to read _meta.json: {e}"
-                    index["validation_errors"].append(error)
-                    logger.error(error)
+    index = assemble_index({
+        skill_dir.name: load_skill(skill_dir.name, skill_dir.path)
+        for skill_dir in iter_skill_dirs()
+    })
 
     # Build content index for full-text search
     with _CONTENT_INDEX_LOCK:
-        _CONTENT_INDEX = build_content_index()
-    logger.info(f"Loaded {len(index['skills'])} skills, indexed {len(_CONTENT_INDEX)} files")
+        set_content_index(build_content_index(), index["generation"])
+        content_count = len(_CONTENT_INDEX)
+    _SEARCH_CACHE.clear()  # Drop results from previous generations
+    logger.info(f"Loaded {len(index['skills'])} skills, indexed {content_count} files")
+
+    return index
+
+
+def reload_skills(skill_names: set) -> dict:
+    """Re-load only the named skill directories and splice them into a new index.
 
+    Unchanged skills keep their parsed records and content entries, so a
+    one-file edit doesn't re-parse every _meta.json. Names whose directory no
+    longer exists are dropped.
+    """
+    global _INDEX
+
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = load_index()
+            return _INDEX
+
+        per_skill = dict(_INDEX["per_skill"])
+        present = set()
+        for skill_name in skill_names:
+            skill_path = os.path.join(SKILLS_DIR, skill_name)
+            if os.path.isdir(skill_path):
+                per_skill[skill_name] = load_skill(skill_name, skill_path)
+                present.add(skill_name)
+            else:
+                per_skill.pop(skill_name, None)
+        index = assemble_index(per_skill)
+
+        with _CONTENT_INDEX_LOCK:
+            content_index = {
+                key: entry for key, entry in (_CONTENT_INDEX or {}).items()
+                if entry["domain"] not in skill_names
+            }
+            seen = set()
+            for skill_name in present:
+                content_index.update(index_skill_content(skill_name, os.path.join(SKILLS_DIR, skill_name), seen))
+
+            # Evict cached files of the reloaded skills that no longer exist
+            prefixes = tuple(os.path.join(SKILLS_DIR, skill_name) + os.sep for skill_name in skill_names)
+            for path in [p for p in _CONTENT_CACHE if p.startswith(prefixes) and p not in seen]:
+                del _CONTENT_CACHE[path]
+
+            set_content_index(content_index, index["generation"])
+        _SEARCH_CACHE.clear()
+
+        _INDEX = index
+    logger.info(f"Reloaded {len(skill_names)} changed skill(s): {', '.join(sorted(skill_names))}")
     return index
 
 
@@ -212,23 +596,20 @@ def get_index() -> dict:
 def track_usage(tool_name: str, details: dict = None):
     """Track tool usage for metrics."""
     with _STATS_LOCK:
-        if tool_name not in _USAGE_STATS["tool_calls"]:
-            _USAGE_STATS["tool_calls"][tool_name] = 0
         _USAGE_STATS["tool_calls"][tool_name] += 1
 
         if details:
             if "domain" in details:
-                domain = details["domain"]
-                if domain not in _USAGE_STATS["skill_loads"]:
-                    _USAGE_STATS["skill_loads"][domain] = 0
-                _USAGE_STATS["skill_loads"][domain] += 1
+                _USAGE_STATS["skill_loads"][details["domain"]] += 1
 
             if "query" in details:
-                _USAGE_STATS["searches"].append({
+                # Deques automatically limit to their maxlen
+                # Epoch seconds; formatted only when stats are read
+                search = {
                     "query": details["query"],
-                    "timestamp": datetime.now().isoformat()
-                })
-                # Deque automatically limits to maxlen=100
+                    "timestamp": time.time()
+                }
+                _USAGE_STATS["searches"].append(search)
 
 
 def check_for_changes() -> bool:
@@ -242,26 +623,22 @@ def check_for_changes() -> bool:
         return False
 
     with _FILE_MTIMES_LOCK:
-        for skill_dir in SKILLS_DIR.iterdir():
-            if not skill_dir.is_dir():
-                continue
-
-            for file in skill_dir.rglob("*"):
-                if file.is_file():
-                    try:
-                        mtime = file.stat().st_mtime
-                        current_mtimes[str(file)] = mtime
-
-                        if str(file) in _FILE_MTIMES:
-                            if _FILE_MTIMES[str(file)] != mtime:
-                                changed = True
-                                logger.info(f"File changed: {file}")
-                        else:
-                            # New file
-                            changed = True
-                    except (OSError, PermissionError) as e:
-                        logger.warning(f"Cannot access {file}: {e}")
-                        continue
+        for skill_dir in iter_skill_dirs():
+            for entry in walk_files(skill_dir.path):
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning(f"Cannot access {entry.path}: {e}")
+                    continue
+
+                current_mtimes[entry.path] = mtime
+                previous = _FILE_MTIMES.get(entry.path)
+                if previous is None:
+                    # New file
+                    changed = True
+                elif previous != mtime:
+                    changed = True
+                    logger.info(f"File changed: {entry.path}")
 
         # Check for deleted files
         for old_file in _FILE_MTIMES:
@@ -275,10 +652,10 @@ def check_for_changes() -> bool:
 
 
 def file_watcher():
-    """Background thread to watch for file changes."""
+    """Background thread to poll for file changes (fallback without watchdog)."""
     global _INDEX
 
-    logger.info("File watcher started")
+    logger.info("File watcher started (polling)")
     while True:
         try:
             if check_for_changes():
@@ -292,9 +669,90 @@ def file_watcher():
         time.sleep(5)  # Check every 5 seconds
 
 
-# Start file watcher in background
-_watcher_thread = Thread(target=file_watcher, daemon=True)
-_watcher_thread.start()
+class SkillsChangeHandler(FileSystemEventHandler):
+    """Signal the reload thread whenever something under SKILLS_DIR changes."""
+
+    # Read-only access events (inotify IN_OPEN/IN_CLOSE_NOWRITE) would otherwise
+    # fire every time load_index() reads the files, causing endless reloads.
+    IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+    def on_any_event(self, event):
+        if event.event_type in self.IGNORED_EVENTS:
+            return
+        changed = {
+            skill_name
+            for path in (event.src_path, getattr(event, "dest_path", ""))
+            if (skill_name := changed_skill_name(path))
+        }
+        if changed:
+            with _CHANGED_SKILLS_LOCK:
+                _CHANGED_SKILLS.update(changed)
+            _RELOAD_EVENT.set()
+
+
+def changed_skill_name(path) -> str | None:
+    """Return the skill directory name a changed path belongs to, if any."""
+    if not path:
+        return None
+    rel_path = os.path.relpath(os.fsdecode(path), SKILLS_DIR)
+    skill_name = rel_path.split(os.sep, 1)[0]
+    if skill_name in (os.curdir, os.pardir) or skill_name.startswith("."):
+        return None
+    return skill_name
+
+
+def reload_on_events():
+    """Background thread that reloads changed skills after debounced file events."""
+    logger.info("File watcher started (event-driven)")
+    while True:
+        _RELOAD_EVENT.wait()
+
+        # Wait until events stop arriving so a burst triggers a single reload
+        while True:
+            _RELOAD_EVENT.clear()
+            time.sleep(WATCH_DEBOUNCE_SECONDS)
+            if not _RELOAD_EVENT.is_set():
+                break
+
+        with _CHANGED_SKILLS_LOCK:
+            skill_names = set(_CHANGED_SKILLS)
+            _CHANGED_SKILLS.clear()
+
+        try:
+            logger.info("Changes detected, reloading changed skills...")
+            reload_skills(skill_names)
+        except Exception as e:
+            logger.error(f"File watcher error: {e}")
+
+
+def start_file_watcher():
+    """Start the event-driven watcher, falling back to polling without watchdog."""
+    if Observer is None:
+        logger.info("watchdog not installed, falling back to polling file watcher")
+        watcher = Thread(target=file_watcher, daemon=True)
+        watcher.start()
+        return watcher
+
+    observer = Observer()
+    observer.schedule(SkillsChangeHandler(), str(SKILLS_DIR), recursive=True)
+    observer.daemon = True
+    observer.start()
+    Thread(target=reload_on_events, daemon=True).start()
+    return observer
+
+
+_watcher_thread = None
+_WATCHER_LOCK = Lock()
+
+
+def ensure_watcher_started():
+    """Start the file watcher on the first tool call rather than at import."""
+    global _watcher_thread
+    if _watcher_thread is not None or not WATCH_ENABLED:
+        return
+    with _WATCHER_LOCK:
+        if _watcher_thread is None:
+            _watcher_thread = start_file_watcher()
 
 
 # Core functions (testable without MCP)
@@ -329,18 +787,20 @@ def _get_skill(name: str) -> dict:
         return {"error": f"Invalid skill path: {name}"}
     
     skill_file = skill_dir / "SKILL.md"
-
-    if not skill_file.exists():
-        return {"error": f"Skill '{name}' not found"}
+    index = get_index()
 
     try:
-        content = skill_file.read_text(encoding="utf-8")
+        # Serve from the content index; fall back to disk for unindexed or changed files
+        content = cached_file_text(name, "SKILL.md", skill_file)
+        if content is None:
+            content = skill_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {"error": f"Skill '{name}' not found"}
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Failed to read skill {name}: {e}")
         return {"error": f"Failed to read skill: {e}"}
 
-    index = get_index()
-    meta = next((s for s in index["skills"] if s["name"] == name), {})
+    meta = index["by_name"].get(name, {})
 
     return {
         "name": name,
@@ -359,11 +819,11 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
     track_usage("get_sub_skill", {"domain": domain, "sub_skill": sub_skill})
 
     index = get_index()
-    meta = next((s for s in index["skills"] if s["name"] == domain), None)
+    meta = index["by_name"].get(domain)
     if not meta:
         return {"error": f"Domain '{domain}' not found"}
 
-    sub = next((s for s in meta.get("sub_skills", []) if s["name"] == sub_skill), None)
+    sub = meta["_sub_by_name"].get(sub_skill)
     if not sub:
         return {"error": f"Sub-skill '{sub_skill}' not found in '{domain}'"}
 
@@ -374,11 +834,13 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
         logger.warning(f"Path traversal attempt detected: domain={domain}, file={sub['file']}")
         return {"error": f"Invalid file path"}
     
-    if not file_path.exists():
-        return {"error": f"File not found: {sub['file']}"}
-
     try:
-        content = file_path.read_text(encoding="utf-8")
+        # Serve from the content index; fall back to disk for unindexed or changed files
+        content = cached_file_text(domain, sub["file"], file_path)
+        if content is None:
+            content = file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {"error": f"File not found: {sub['file']}"}
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Failed to read sub-skill {domain}/{sub_skill}: {e}")
         return {"error": f"Failed to read sub-skill: {e}"}
@@ -390,19 +852,25 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
     }
 
 
+def _load_batch_item(req: dict) -> dict:
+    """Load one entry of a get_skills_batch request."""
+    domain = req.get("domain")
+    sub_skill = req.get("sub_skill")
+
+    if sub_skill:
+        return _get_sub_skill(domain, sub_skill)
+    return _get_skill(domain)
+
+
 def _get_skills_batch(requests: list[dict]) -> dict:
     """Load multiple skills/sub-skills in a single request."""
     track_usage("get_skills_batch")
 
-    results = []
-    for req in requests:
-        domain = req.get("domain")
-        sub_skill = req.get("sub_skill")
-
-        if sub_skill:
-            results.append(_get_sub_skill(domain, sub_skill))
-        else:
-            results.append(_get_skill(domain))
+    # Reads are independent, so load them concurrently (map preserves order)
+    if len(requests) > 1:
+        results = list(_BATCH_EXECUTOR.map(_load_batch_item, requests))
+    else:
+        results = [_load_batch_item(req) for req in requests]
 
     return {"results": results}
 
@@ -422,21 +890,33 @@ def _search_skills(query: str, limit: int = 5) -> dict:
     track_usage("search_skills", {"query": query})
 
     query_lower = query.lower()
-    results = []
     index = get_index()
 
+    cache_key = ("skills", index.get("generation"), query_lower, limit)
+    results = _SEARCH_CACHE.get(cache_key)
+    if results is None:
+        results = tuple(score_skills(index, query_lower)[:limit])
+        _SEARCH_CACHE.put(cache_key, results)
+
+    return {"query": query, "results": [dict(r) for r in results]}
+
+
+def score_skills(index: dict, query_lower: str) -> list[dict]:
+    """Score skills and sub-skills against a lowercased query, best first."""
+    results = []
+
     for skill in index["skills"]:
         # Check domain-level matches
         score = 0
         match_type = None
 
-        if query_lower in skill["name"].lower():
+        if query_lower in skill["_name_lc"]:
             score = 0.9
             match_type = "name"
-        elif query_lower in skill["description"].lower():
+        elif query_lower in skill["_desc_lc"]:
             score = 0.7
             match_type = "description"
-        elif any(query_lower in tag.lower() for tag in skill.get("tags", [])):
+        elif any(query_lower in tag for tag in skill["_tags_lc"]):
             score = 0.8
             match_type = "tags"
 
@@ -453,10 +933,10 @@ def _search_skills(query: str, limit: int = 5) -> dict:
             sub_score = 0
             sub_match = None
 
-            if query_lower in sub["name"].lower():
+            if query_lower in sub["_name_lc"]:
                 sub_score = 0.85
                 sub_match = "name"
-            elif any(query_lower in t.lower() for t in sub.get("triggers", [])):
+            elif any(query_lower in t for t in sub["_triggers_lc"]):
                 sub_score = 0.9
                 sub_match = "triggers"
 
@@ -469,7 +949,7 @@ def _search_skills(query: str, limit: int = 5) -> dict:
                 })
 
     results.sort(key=lambda x: x["score"], reverse=True)
-    return {"query": query, "results": results[:limit]}
+    return results
 
 
 def _search_content(query: str, limit: int = 10) -> dict:
@@ -481,7 +961,8 @@ def _search_content(query: str, limit: int = 10) -> dict:
     if len(query) > 1000:
         return {"error": "Query too long (max 1000 characters)", "results": []}
     
-    query_words = query.lower().split()
+    query_lower = query.lower()
+    query_words = query_lower.split()
     if len(query_words) > 100:
         return {"error": "Too many search terms (max 100 words)", "results": []}
     
@@ -490,75 +971,147 @@ def _search_content(query: str, limit: int = 10) -> dict:
     
     track_usage("search_content", {"query": query})
 
+    if _CONTENT_INDEX is None:
+        get_index()  # Ensure index is loaded (load_index takes _CONTENT_INDEX_LOCK itself)
+
+    # Indexes are replaced wholesale on reload, so a snapshot can be searched unlocked
     with _CONTENT_INDEX_LOCK:
-        if _CONTENT_INDEX is None:
-            get_index()  # Ensure index is loaded
+        files = _CONTENT_FILES
+        postings = _CONTENT_POSTINGS
+        generation = _CONTENT_GENERATION
+
+    cache_key = ("content", generation, query_lower, limit)
+    results = _SEARCH_CACHE.get(cache_key)
+    if results is None:
+        results = tuple(score_content(files, postings, query_lower, query_words)[:limit])
+        _SEARCH_CACHE.put(cache_key, results)
+
+    return {"query": query, "results": [dict(r) for r in results]}
+
+
+def score_content(files: list, postings: dict, query_lower: str, query_words: list[str]) -> list[dict]:
+    """Score indexed files against a lowercased query, best first."""
+    word_masks = {word: files_containing(word, files, postings) for word in set(query_words)}
+    any_word_mask = 0
+    all_words_mask = -1  # All bits set
+    for mask in word_masks.values():
+        any_word_mask |= mask
+        all_words_mask &= mask
+    query_bytes = query_lower.encode("utf-8")
+    word_bytes = [word.encode("utf-8") for word in query_words]
+    results = []
 
-        query_lower = query.lower()
-        results = []
+    # Only files containing at least one query word can score; ids ascend in index order
+    for file_id in iter_file_ids(any_word_mask):
+        entry = files[file_id]
+        file_bit = 1 << file_id
+        content = entry["content"]
 
-        for key, entry in _CONTENT_INDEX.items():
-            content = entry["content"]
+        # Calculate relevance score
+        score = 0
 
-            # Calculate relevance score
-            score = 0
+        # Exact phrase match (highest priority)
+        match_pos = content.find(query_bytes)
+        if match_pos != -1:
+            score = 1.0
+            # Boost for matches in first 500 chars (likely headings/intro)
+            if _within_chars(content, match_pos + len(query_bytes), 500):
+                score = 1.2
 
-            # Exact phrase match (highest priority)
-            if query_lower in content:
-                score = 1.0
-                # Boost for matches in first 500 chars (likely headings/intro)
-                if query_lower in content[:500]:
-                    score = 1.2
+        # All words present (medium priority)
+        elif all_words_mask & file_bit:
+            score = 0.7
+            matches = sum(content.count(word) for word in word_bytes)
+            score += min(matches * 0.05, 0.2)  # Bonus for frequency, capped
 
-            # All words present (medium priority)
-            elif all(word in content for word in query_words):
-                score = 0.7
-                matches = sum(content.count(word) for word in query_words)
-                score += min(matches * 0.05, 0.2)  # Bonus for frequency, capped
+        # Some words present (lower priority)
+        else:
+            matches = sum(1 for word in query_words if word_masks[word] & file_bit)
+            if matches > 0:
+                score = 0.3 * (matches / len(query_words))
 
-            # Some words present (lower priority)
-            else:
-                matches = sum(1 for word in query_words if word in content)
-                if matches > 0:
-                    score = 0.3 * (matches / len(query_words))
+        if score > 0:
+            if match_pos == -1:
+                # Anchor the snippet on the first query word present
+                for word in word_bytes:
+                    match_pos = content.find(word)
+                    if match_pos != -1:
+                        break
 
-            if score > 0:
-                # Extract snippet around match
-                snippet = extract_snippet(content, query_lower, 150)
+            # Extract snippet around match
+            snippet = extract_snippet(content, query_lower, 150, match_pos=match_pos)
 
-                results.append({
-                    "domain": entry["domain"],
-                    "sub_skill": entry["sub_skill"],
-                    "file": entry["file"],
-                    "score": round(score, 3),
-                    "snippet": snippet
-                })
+            results.append({
+                "domain": entry["domain"],
+                "sub_skill": entry["sub_skill"],
+                "file": entry["file"],
+                "score": round(score, 3),
+                "snippet": snippet
+            })
 
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return {"query": query, "results": results[:limit]}
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results
 
 
-def extract_snippet(content: str, query: str, max_length: int = 150) -> str:
-    """Extract a snippet around the query match."""
-    pos = content.find(query)
-    if pos == -1:
+def _within_chars(content: bytes, byte_pos: int, limit: int) -> bool:
+    """
+    Whether byte_pos, a character boundary in UTF-8 content, lies within the
+    first limit characters. At most 4 * limit bytes are decoded.
+    """
+    if byte_pos <= limit:
+        return True  # Never more characters than bytes
+    if byte_pos > 4 * limit:
+        return False  # Never fewer than a quarter as many
+    return len(content[:byte_pos].decode("utf-8", errors="ignore")) <= limit
+
+
+def extract_snippet(content: str | bytes, query: str, max_length: int = 150, match_pos: int | None = None) -> str:
+    """Extract a snippet around the query match.
+
+    content may also be UTF-8 bytes as stored in the content index; offsets are
+    then in bytes, but the snippet spans the same characters as for str content
+    and only the bytes around it are decoded. Callers that already located the
+    match pass its offset as match_pos (-1 for no match) to skip searching the
+    content again.
+    """
+    is_bytes = isinstance(content, bytes)
+
+    if match_pos is not None:
+        pos = match_pos
+    else:
+        pos = content.find(query.encode("utf-8") if is_bytes else query)
+    if pos == -1 and match_pos is None:
         # Try finding first query word
         for word in query.split():
-            pos = content.find(word)
+            pos = content.find(word.encode("utf-8") if is_bytes else word)
             if pos != -1:
                 break
 
     if pos == -1:
+        if is_bytes:
+            # A character is at most 4 bytes; a cut-off trailing one is dropped
+            return content[:4 * max_length].decode("utf-8", errors="ignore")[:max_length] + "..."
         return content[:max_length] + "..."
 
-    start = max(0, pos - 50)
-    end = min(len(content), pos + max_length)
-
-    snippet = content[start:end]
-
-    if start > 0:
+    if is_bytes:
+        # Decode just enough bytes on each side for 50 / max_length characters
+        # (plus 3 for a partial character cut at the window's far edge)
+        window_start = max(0, pos - 4 * 50 - 3)
+        before = content[window_start:pos].decode("utf-8", errors="ignore")
+        after = content[pos:pos + 4 * max_length + 3].decode("utf-8", errors="ignore")
+        has_before = window_start > 0 or len(before) > 50
+        has_after = len(after) > max_length
+        snippet = before[-50:] + after[:max_length]
+    else:
+        start = max(0, pos - 50)
+        end = min(len(content), pos + max_length)
+        has_before = start > 0
+        has_after = end < len(content)
+        snippet = content[start:end]
+
+    if has_before:
         snippet = "..." + snippet
-    if end < len(content):
+    if has_after:
         snippet = snippet + "..."
 
     return snippet.replace('\n', ' ').strip()
@@ -587,11 +1140,15 @@ def _get_stats() -> dict:
     """Get usage statistics."""
     # Acquire locks in consistent order to avoid deadlock
     with _STATS_LOCK:
+        searches = _USAGE_STATS["searches"]
         stats_copy = {
             "uptime_since": _USAGE_STATS["start_time"],
-            "tool_calls": _USAGE_STATS["tool_calls"].copy(),
-            "skill_loads": _USAGE_STATS["skill_loads"].copy(),
-            "recent_searches": list(_USAGE_STATS["searches"])[-10:],  # Last 10 searches
+            "tool_calls": dict(_USAGE_STATS["tool_calls"]),
+            "skill_loads": dict(_USAGE_STATS["skill_loads"]),
+            "recent_searches": [  # Last 10 searches
+                {**search, "timestamp": datetime.fromtimestamp(search["timestamp"]).isoformat()}
+                for search in islice(searches, max(0, len(searches) - 10), None)
+            ],
         }
     
     # Get index info without holding stats lock
@@ -605,69 +1162,62 @@ def _get_stats() -> dict:
 
 
 def _validate_skills() -> dict:
-    """Validate all skill metadata."""
+    """Validate all skill metadata.
+
+    _meta.json findings come from the loaded index; only checks that depend on
+    other files (SKILL.md and sub-skill files) touch the filesystem.
+    """
     errors = []
     warnings = []
+    index = get_index()
+    per_skill = index.get("per_skill", {})
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir():
+    for skill_name, info in per_skill.items():
+        if not info["has_meta"]:
+            errors.extend(info["errors"])
             continue
 
-        skill_name = skill_dir.name
-        meta_file = skill_dir / "_meta.json"
-        skill_file = skill_dir / "SKILL.md"
+        skill_dir = SKILLS_DIR / skill_name
 
-        # Check required files
-        if not meta_file.exists():
-            errors.append(f"{skill_name}: Missing _meta.json")
-            continue
-
-        if not skill_file.exists():
+        if not (skill_dir / "SKILL.md").exists():
             errors.append(f"{skill_name}: Missing SKILL.md")
 
-        # Validate meta
-        try:
-            meta = json.loads(meta_file.read_text(encoding="utf-8"))
-            meta_errors = validate_meta(meta, skill_name)
-            errors.extend(meta_errors)
+        errors.extend(info["errors"])
 
-            # Check sub-skill files exist
+        # Check sub-skill files exist
+        meta = info["meta"]
+        if meta is not None:
             for sub in meta.get("sub_skills", []):
                 sub_file = skill_dir / sub["file"]
                 if not sub_file.exists():
                     errors.append(f"{skill_name}: Sub-skill file not found: {sub['file']}")
 
-            # Warnings for potential issues
-            if not meta.get("tags"):
-                warnings.append(f"{skill_name}: No tags defined")
-
-            if not meta.get("sub_skills"):
-                warnings.append(f"{skill_name}: No sub-skills defined (standalone skill)")
-
-        except json.JSONDecodeError as e:
-            errors.append(f"{skill_name}: Invalid JSON in _meta.json: {e}")
+        warnings.extend(info["warnings"])
 
     return {
         "valid": len(errors) == 0,
         "errors": errors,
         "warnings": warnings,
-        "skills_checked": sum(1 for d in SKILLS_DIR.iterdir() if d.is_dir())
+        "skills_checked": len(per_skill)
     }
 
 
 # MCP Tool wrappers
+# Handlers are async so blocking file I/O runs in worker threads instead of
+# stalling the event loop, letting concurrent tool calls overlap.
 @mcp.tool()
-def list_skills() -> dict:
+async def list_skills() -> dict:
     """
     List all available skill domains with descriptions.
     Use this to understand what skills exist before loading specific content.
     Returns domain names, descriptions, and available sub-skills.
     """
-    return _list_skills()
+    ensure_watcher_started()
+    return await asyncio.to_thread(_list_skills)
 
 
 @mcp.tool()
-def get_skill(name: str) -> dict:
+async def get_skill(name: str) -> dict:
     """
     Load a skill's main SKILL.md content.
     For domain skills with sub-skills, this returns the router/overview.
@@ -675,11 +1225,12 @@ def get_skill(name: str) -> dict:
     Args:
         name: Skill domain name (e.g., "forms", "building", "component-library")
     """
-    return _get_skill(name)
+    ensure_watcher_started()
+    return await asyncio.to_thread(_get_skill, name)
 
 
 @mcp.tool()
-def get_sub_skill(domain: str, sub_skill: str) -> dict:
+async def get_sub_skill(domain: str, sub_skill: str) -> dict:
     """
     Load a specific sub-skill's content from a domain.
 
@@ -687,11 +1238,12 @@ def get_sub_skill(domain: str, sub_skill: str) -> dict:
         domain: Parent skill domain (e.g., "forms")
         sub_skill: Sub-skill name (e.g., "validation", "react")
     """
-    return _get_sub_skill(domain, sub_skill)
+    ensure_watcher_started()
+    return await asyncio.to_thread(_get_sub_skill, domain, sub_skill)
 
 
 @mcp.tool()
-def get_skills_batch(requests: list[dict]) -> dict:
+async def get_skills_batch(requests: list[dict]) -> dict:
     """
     Load multiple skills/sub-skills in a single request.
 
@@ -706,11 +1258,12 @@ def get_skills_batch(requests: list[dict]) -> dict:
             {"domain": "forms", "sub_skill": "validation"}
         ]
     """
-    return _get_skills_batch(requests)
+    ensure_watcher_started()
+    return await asyncio.to_thread(_get_skills_batch, requests)
 
 
 @mcp.tool()
-def search_skills(query: str, limit: int = 5) -> dict:
+async def search_skills(query: str, limit: int = 5) -> dict:
     """
     Search skills by keyword/phrase. Searches names, descriptions,
     tags, and trigger words.
@@ -719,11 +1272,12 @@ def search_skills(query: str, limit: int = 5) -> dict:
         query: Search term (e.g., "zod validation", "multiplayer sync")
         limit: Max results to return
     """
-    return _search_skills(query, limit)
+    ensure_watcher_started()
+    return await asyncio.to_thread(_search_skills, query, limit)
 
 
 @mcp.tool()
-def search_content(query: str, limit: int = 10) -> dict:
+async def search_content(query: str, limit: int = 10) -> dict:
     """
     Full-text search across all skill content.
     Searches the actual markdown content of skills and sub-skills.
@@ -733,36 +1287,41 @@ def search_content(query: str, limit: int = 10) -> dict:
         query: Search term or phrase (e.g., "useForm hook", "delta compression")
         limit: Max results to return (default 10)
     """
-    return _search_content(query, limit)
+    ensure_watcher_started()
+    return await asyncio.to_thread(_search_content, query, limit)
 
 
 @mcp.tool()
-def reload_index() -> dict:
+async def reload_index() -> dict:
     """
     Reload the skill index from disk.
     Use this after adding or modifying skill files.
     Also rebuilds the full-text search index.
     """
-    return _reload_index()
+    ensure_watcher_started()
+    return await asyncio.to_thread(_reload_index)
 
 
 @mcp.tool()
-def get_stats() -> dict:
+async def get_stats() -> dict:
     """
     Get usage statistics for the skills server.
     Shows which skills are most used, recent searches, and uptime.
     """
-    return _get_stats()
+    ensure_watcher_started()
+    return await asyncio.to_thread(_get_stats)
 
 
 @mcp.tool()
-def validate_skills() -> dict:
+async def validate_skills() -> dict:
     """
     Validate all skill metadata and file structure.
     Checks for missing files, invalid JSON, and schema violations.
+    Metadata is checked as of the last index load (see reload_index).
     Returns errors and warnings.
     """
-    return _validate_skills()
+    ensure_watcher_started()
+    return await asyncio.to_thread(_validate_skills)
 
 
 if __name__ == "__main__":
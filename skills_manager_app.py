@@ -12,12 +12,12 @@ import threading
 
 # Try to import Flask
 try:
-    from flask import Flask, jsonify, request, send_from_directory
+    from flask import Flask, Response, jsonify, request
     from flask_cors import CORS
 except ImportError:
     print("Installing required packages...")
     subprocess.run([sys.executable, "-m", "pip", "install", "flask", "flask-cors"], check=True)
-    from flask import Flask, jsonify, request, send_from_directory
+    from flask import Flask, Response, jsonify, request
     from flask_cors import CORS
 
 # Import from core module
@@ -25,28 +25,41 @@ from core import (
     get_skills_dir,
     get_app_dir,
     find_claude_cli,
-    list_all_skills,
+    iter_all_skills,
+    skills_etag,
     get_skill_by_name,
     create_skill,
     update_skill,
     delete_skill,
     import_folder,
     import_files_json,
+    purge_trash,
     browse_skills_directory,
     get_claude_status,
+    clear_claude_cli_cache,
     run_claude_prompt,
+    stream_claude_prompt,
     generate_skill_with_claude,
 )
+from core.compress import configure_compression
+from core.json_provider import configure_json_provider, error_response, stream_json_list
+from core.ratelimit import claude_rate_limit
+from core.static import send_cached_page
+from core.wsgi import serve
 
 # Configuration
 PORT = 5050
 HOST = "127.0.0.1"
+PORT_CHECK_TIMEOUT = 0.2  # Seconds; a loopback connect answers at once unless filtered
 
 APP_DIR = get_app_dir()
 SKILLS_DIR = get_skills_dir()
+HTML_MAX_AGE = 300  # Seconds browsers may reuse skills-manager.html without asking
 
 # Create Flask app
 app = Flask(__name__, static_folder=str(APP_DIR))
+configure_json_provider(app)
+configure_compression(app)
 
 # Security: Restrict CORS to localhost origins only
 CORS(app, origins=[
@@ -61,13 +74,23 @@ CORS(app, origins=[
 
 @app.route('/')
 def index():
-    return send_from_directory(str(APP_DIR), 'skills-manager.html')
+    # Served from memory; revalidated by ETag/Last-Modified (304) once the short max-age lapses
+    return send_cached_page(str(APP_DIR), 'skills-manager.html', max_age=HTML_MAX_AGE)
 
 
 @app.route('/api/skills', methods=['GET'])
 def api_list_skills():
     """List all skills with their metadata."""
-    return jsonify({"skills": list_all_skills()})
+    # Let polling clients revalidate without re-sending the list
+    etag = skills_etag()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        # SKILL.md bodies only on request; GET /api/skills/<name> has them
+        include_content = request.args.get("include_content") == "1"
+        response = stream_json_list("skills", iter_all_skills(include_content))
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route('/api/skills/<name>', methods=['GET'])
@@ -75,7 +98,7 @@ def api_get_skill(name):
     """Get a specific skill's details."""
     skill_data, error = get_skill_by_name(name)
     if error:
-        return jsonify({"error": error}), 404
+        return error_response(error, 404)
     return jsonify(skill_data)
 
 
@@ -92,7 +115,7 @@ def api_create_skill():
     )
     if error:
         status = 409 if "exists" in error else 400
-        return jsonify({"error": error}), status
+        return error_response(error, status)
     return jsonify(result)
 
 
@@ -107,7 +130,7 @@ def api_update_skill(name):
         tags=data.get("tags"),
     )
     if error:
-        return jsonify({"error": error}), 404
+        return error_response(error, 404)
     return jsonify(result)
 
 
@@ -116,7 +139,7 @@ def api_delete_skill(name):
     """Delete a skill."""
     result, error = delete_skill(name)
     if error:
-        return jsonify({"error": error}), 404
+        return error_response(error, 404)
     return jsonify(result)
 
 
@@ -130,7 +153,7 @@ def api_import_folder():
     )
     if error:
         status = 404 if "not found" in error.lower() else 409 if "exists" in error else 400
-        return jsonify({"error": error}), status
+        return error_response(error, status)
     return jsonify(result)
 
 
@@ -143,7 +166,7 @@ def api_import_files_json():
         files=data.get("files", []),
     )
     if error:
-        return jsonify({"error": error}), 400
+        return error_response(error, 400)
     return jsonify(result)
 
 
@@ -158,7 +181,7 @@ def api_browse_filesystem():
     result, error = browse_skills_directory(relative_path)
     if error:
         status = 403 if "denied" in error.lower() else 404
-        return jsonify({"error": error}), status
+        return error_response(error, status)
     return jsonify(result)
 
 
@@ -168,7 +191,15 @@ def api_claude_status():
     return jsonify(get_claude_status())
 
 
+@app.route('/api/claude/refresh', methods=['POST'])
+def api_claude_refresh():
+    """Forget the cached CLI lookup and report the freshly probed status."""
+    clear_claude_cli_cache()
+    return jsonify(get_claude_status())
+
+
 @app.route('/api/claude/run', methods=['POST'])
+@claude_rate_limit
 def api_claude_run():
     """Run a prompt through Claude CLI."""
     data = request.json
@@ -178,24 +209,41 @@ def api_claude_run():
     )
     if error:
         status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 500
-        return jsonify({"error": error}), status
+        return error_response(error, status)
     return jsonify(result)
 
 
+@app.route('/api/claude/run/stream', methods=['POST'])
+@claude_rate_limit
+def api_claude_run_stream():
+    """Run a prompt through Claude CLI, streaming output as plain text."""
+    data = request.json
+    output, error = stream_claude_prompt(
+        prompt=data.get("prompt", ""),
+        skill_context=data.get("skill_context", ""),
+    )
+    if error:
+        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 500
+        return error_response(error, status)
+    return Response(output, mimetype="text/plain")
+
+
 @app.route('/api/claude/generate-skill', methods=['POST'])
+@claude_rate_limit
 def api_claude_generate_skill():
     """Generate a skill using Claude CLI."""
     data = request.json
     result, error = generate_skill_with_claude(idea=data.get("idea", ""))
     if error:
         status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 400
-        return jsonify({"error": error}), status
+        return error_response(error, status)
     return jsonify(result)
 
 
 @app.route('/api/reload', methods=['POST'])
 def api_reload_index():
     """Reload skills index."""
+    clear_claude_cli_cache()  # Re-probe for a newly installed CLI
     return jsonify({"success": True})
 
 
@@ -203,6 +251,7 @@ def api_reload_index():
 
 def is_port_in_use(port):
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(PORT_CHECK_TIMEOUT)
         return s.connect_ex((HOST, port)) == 0
 
 
@@ -232,10 +281,11 @@ def main():
         input("\nPress Enter to exit...")
         return
 
+    purge_trash()
     threading.Thread(target=open_browser, daemon=True).start()
 
     try:
-        app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+        serve(app, host=HOST, port=PORT)
     except KeyboardInterrupt:
         print("\n[*] Stopped.")
 
@@ -62,13 +62,14 @@ def main():
         sys.path.insert(0, str(app_dir))
         
         from skills_manager_api import app, SKILLS_DIR, find_claude_cli
+        from core.wsgi import serve
         
         print(f"[✓] Skills directory: {SKILLS_DIR}")
         print(f"[✓] Claude CLI: {find_claude_cli() or 'Not found'}")
         print(f"\n[*] Server starting...\n")
         
-        # Run Flask (this blocks)
-        app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+        # Run the server (this blocks); waitress when installed
+        serve(app, host=HOST, port=PORT)
         
     except KeyboardInterrupt:
         print("\n[*] Server stopped.")
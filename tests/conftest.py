@@ -12,6 +12,26 @@ import os
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(autouse=True)
+def clear_claude_cli_cache():
+    """Make every test probe for the Claude CLI afresh (the lookup is memoized)."""
+    from core.claude_cli import clear_claude_cli_cache
+
+    clear_claude_cli_cache()
+    yield
+    clear_claude_cli_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_claude_rate_limit():
+    """Start every test with an empty Claude rate-limit window."""
+    from core.ratelimit import claude_rate_limit
+
+    claude_rate_limit.reset()
+    yield
+    claude_rate_limit.reset()
+
+
 @pytest.fixture
 def temp_skills_dir(tmp_path):
     """Create a temporary skills directory with test skills."""
@@ -241,6 +261,21 @@ def flask_test_client(temp_skills_dir):
     api.SKILLS_DIR = original_skills_dir
 
 
+@pytest.fixture
+def core_skills_dir(temp_skills_dir):
+    """Point the core module at the temporary skills directory."""
+    from core import config, skills
+
+    original_skills_dir = config._skills_dir
+    config._skills_dir = temp_skills_dir
+    skills._FILE_CACHE.clear()
+
+    yield temp_skills_dir
+
+    config._skills_dir = original_skills_dir
+    skills._FILE_CACHE.clear()
+
+
 @pytest.fixture
 def flask_app_test_client(temp_skills_dir):
     """Create a Flask test client for the standalone app."""
@@ -283,16 +318,32 @@ def mock_subprocess():
         yield mock_run
 
 
+@pytest.fixture
+def mock_popen():
+    """Mock subprocess.Popen for Claude CLI runs that read the output pipes."""
+    import io
+
+    with patch('subprocess.Popen') as mock_popen:
+        process = mock_popen.return_value
+        process.stdout = io.StringIO("Mock Claude response")
+        process.stderr = io.StringIO("")
+        process.wait.return_value = 0
+        yield mock_popen
+
+
 @pytest.fixture
 def server_module(temp_skills_dir):
     """Import and configure the server module with test directory."""
     import server
-    from collections import deque
+    from collections import Counter, deque
 
     # Save original values
     original_skills_dir = server.SKILLS_DIR
     original_index = server._INDEX
     original_content_index = server._CONTENT_INDEX
+    original_content_files = server._CONTENT_FILES
+    original_content_postings = server._CONTENT_POSTINGS
+    original_content_cache = server._CONTENT_CACHE
     original_file_mtimes = server._FILE_MTIMES
     original_usage_stats = server._USAGE_STATS.copy()
 
@@ -300,10 +351,14 @@ def server_module(temp_skills_dir):
     server.SKILLS_DIR = temp_skills_dir
     server._INDEX = None
     server._CONTENT_INDEX = None
+    server._CONTENT_FILES = []
+    server._CONTENT_POSTINGS = {}
+    server._CONTENT_CACHE = {}
     server._FILE_MTIMES = {}
+    server._SEARCH_CACHE.clear()
     server._USAGE_STATS = {
-        "tool_calls": {},
-        "skill_loads": {},
+        "tool_calls": Counter(),
+        "skill_loads": Counter(),
         "searches": deque(maxlen=100),  # Use deque with maxlen like production
         "start_time": "2024-01-01T00:00:00"
     }
@@ -314,5 +369,8 @@ def server_module(temp_skills_dir):
     server.SKILLS_DIR = original_skills_dir
     server._INDEX = original_index
     server._CONTENT_INDEX = original_content_index
+    server._CONTENT_FILES = original_content_files
+    server._CONTENT_POSTINGS = original_content_postings
+    server._CONTENT_CACHE = original_content_cache
     server._FILE_MTIMES = original_file_mtimes
     server._USAGE_STATS = original_usage_stats
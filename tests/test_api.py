@@ -102,8 +102,8 @@ class TestListSkillsEndpoint:
         assert "tags" in skill
 
     def test_includes_content(self, flask_test_client, sample_skill):
-        """Test that skill content is included."""
-        response = flask_test_client.get('/api/skills')
+        """Test that skill content is included on request."""
+        response = flask_test_client.get('/api/skills?include_content=1')
         data = response.get_json()
         skill = next(s for s in data["skills"] if s["name"] == "test-skill")
         assert "content" in skill
@@ -134,6 +134,44 @@ class TestListSkillsEndpoint:
         assert data["skills"] == []
 
 
+class TestListSkillsEtag:
+    """Tests for ETag revalidation on GET /api/skills."""
+
+    def test_returns_304_when_unchanged(self, flask_test_client, core_skills_dir, sample_skill):
+        """Test that a matching If-None-Match short-circuits the listing."""
+        first = flask_test_client.get('/api/skills')
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+
+        second = flask_test_client.get('/api/skills', headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_returns_200_after_change(self, flask_test_client, core_skills_dir, sample_skill):
+        """Test that a stale ETag gets the full listing."""
+        etag = flask_test_client.get('/api/skills').headers["ETag"]
+        meta = json.loads((sample_skill / "_meta.json").read_text())
+        meta["description"] = "Edited"
+        (sample_skill / "_meta.json").write_text(json.dumps(meta))
+
+        response = flask_test_client.get('/api/skills', headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["skills"][0]["description"] == "Edited"
+
+
+class TestIndexPage:
+    """Tests for GET / (the web UI)."""
+
+    def test_serves_html_with_cache_headers(self, flask_test_client):
+        """Test that the page is cacheable and revalidates with a 304."""
+        response = flask_test_client.get('/')
+        assert response.status_code == 200
+        assert "max-age=300" in response.headers["Cache-Control"]
+
+        cached = flask_test_client.get('/', headers={"If-None-Match": response.headers["ETag"]})
+        assert cached.status_code == 304
+
+
 class TestGetSkillEndpoint:
     """Tests for GET /api/skills/<name> endpoint."""
 
@@ -507,10 +545,25 @@ class TestClaudeStatusEndpoint:
             assert data["available"] is False
 
 
+class TestClaudeRefreshEndpoint:
+    """Tests for POST /api/claude/refresh endpoint."""
+
+    def test_reprobes_cli(self, flask_test_client):
+        """Test that a refresh picks up a CLI that appeared after the first lookup."""
+        with patch('core.config.shutil.which', return_value=None), \
+                patch('core.config.os.path.exists', return_value=False):
+            assert flask_test_client.get('/api/claude/status').get_json()["available"] is False
+
+        with patch('core.claude_cli._cli_version', return_value='1.0.0'), \
+                patch('core.config.shutil.which', return_value='/usr/bin/claude'):
+            data = flask_test_client.post('/api/claude/refresh').get_json()
+        assert data == {"available": True, "path": "/usr/bin/claude", "version": "1.0.0"}
+
+
 class TestClaudeRunEndpoint:
     """Tests for POST /api/claude/run endpoint."""
 
-    def test_runs_claude(self, flask_test_client, mock_subprocess):
+    def test_runs_claude(self, flask_test_client, mock_popen):
         """Test running Claude CLI."""
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
             response = flask_test_client.post('/api/claude/run',
@@ -521,7 +574,7 @@ class TestClaudeRunEndpoint:
             assert data["success"] is True
             assert "stdout" in data
 
-    def test_includes_skill_context(self, flask_test_client, mock_subprocess):
+    def test_includes_skill_context(self, flask_test_client, mock_popen):
         """Test that skill context is included in prompt."""
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
             response = flask_test_client.post('/api/claude/run',
@@ -532,7 +585,7 @@ class TestClaudeRunEndpoint:
             )
             assert response.status_code == 200
             # Verify context was passed
-            call_args = mock_subprocess.call_args
+            call_args = mock_popen.call_args
             full_prompt = call_args[0][0][2]  # Third arg in command list
             assert "skill context" in full_prompt.lower()
 
@@ -544,23 +597,33 @@ class TestClaudeRunEndpoint:
             )
             assert response.status_code == 404
 
-    def test_handles_timeout(self, flask_test_client):
+    def test_handles_timeout(self, flask_test_client, mock_popen):
         """Test handling of timeout."""
         import subprocess
+        mock_popen.return_value.wait.side_effect = [subprocess.TimeoutExpired('cmd', 120), -9]
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 120)):
-                response = flask_test_client.post('/api/claude/run',
-                    json={"prompt": "Test"}
-                )
-                assert response.status_code == 408
+            response = flask_test_client.post('/api/claude/run',
+                json={"prompt": "Test"}
+            )
+            assert response.status_code == 408
+        mock_popen.return_value.kill.assert_called_once()
+
+    def test_stream_returns_408_without_a_free_slot(self, flask_test_client):
+        """Test that the streaming route reports a slot timeout like the others."""
+        with patch('skills_manager_api.stream_claude_prompt', return_value=(None, "Timeout")):
+            response = flask_test_client.post('/api/claude/run/stream',
+                json={"prompt": "Test"}
+            )
+            assert response.status_code == 408
 
 
 class TestClaudeGenerateSkillEndpoint:
     """Tests for POST /api/claude/generate-skill endpoint."""
 
-    def test_generates_skill(self, flask_test_client, mock_subprocess):
+    def test_generates_skill(self, flask_test_client, mock_popen):
         """Test generating a skill."""
-        mock_subprocess.return_value.stdout = """---
+        import io
+        mock_popen.return_value.stdout = io.StringIO("""---
 name: generated-skill
 description: A generated skill
 ---
@@ -568,7 +631,7 @@ description: A generated skill
 # Generated Skill
 
 Content here.
-"""
+""")
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
             response = flask_test_client.post('/api/claude/generate-skill',
                 json={"idea": "A skill for testing"}
@@ -599,9 +662,10 @@ Content here.
 class TestClaudeImproveSkillEndpoint:
     """Tests for POST /api/claude/improve-skill endpoint."""
 
-    def test_improves_skill(self, flask_test_client, sample_skill, mock_subprocess):
+    def test_improves_skill(self, flask_test_client, sample_skill, mock_popen):
         """Test improving a skill."""
-        mock_subprocess.return_value.stdout = "# Improved Content"
+        import io
+        mock_popen.return_value.stdout = io.StringIO("# Improved Content")
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
             response = flask_test_client.post('/api/claude/improve-skill',
                 json={
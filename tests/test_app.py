@@ -377,35 +377,29 @@ class TestClaudeStatusEndpoint:
 class TestClaudeRunEndpoint:
     """Tests for POST /api/claude/run endpoint in app."""
 
-    def test_runs_prompt(self, flask_app_test_client):
+    def test_runs_prompt(self, flask_app_test_client, mock_popen):
         """Test running a prompt."""
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value.stdout = "Response"
-                mock_run.return_value.stderr = ""
-                response = flask_app_test_client.post('/api/claude/run',
-                    json={"prompt": "Test"}
-                )
-                assert response.status_code == 200
-                data = response.get_json()
-                assert data["success"] is True
+            response = flask_app_test_client.post('/api/claude/run',
+                json={"prompt": "Test"}
+            )
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["success"] is True
 
-    def test_includes_context(self, flask_app_test_client):
+    def test_includes_context(self, flask_app_test_client, mock_popen):
         """Test skill context is included."""
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value.stdout = "Response"
-                mock_run.return_value.stderr = ""
-                response = flask_app_test_client.post('/api/claude/run',
-                    json={
-                        "prompt": "Help",
-                        "skill_context": "Context here"
-                    }
-                )
-                assert response.status_code == 200
-                # Verify context was in the command
-                call_args = mock_run.call_args[0][0]
-                assert "Context here" in call_args[2]
+            response = flask_app_test_client.post('/api/claude/run',
+                json={
+                    "prompt": "Help",
+                    "skill_context": "Context here"
+                }
+            )
+            assert response.status_code == 200
+            # Verify context was in the command
+            call_args = mock_popen.call_args[0][0]
+            assert "Context here" in call_args[2]
 
     def test_returns_404_without_cli(self, flask_app_test_client):
         """Test 404 when CLI not found."""
@@ -415,37 +409,36 @@ class TestClaudeRunEndpoint:
             )
             assert response.status_code == 404
 
-    def test_handles_timeout(self, flask_app_test_client):
+    def test_handles_timeout(self, flask_app_test_client, mock_popen):
         """Test timeout handling."""
         import subprocess
+        mock_popen.return_value.wait.side_effect = [subprocess.TimeoutExpired('cmd', 120), -9]
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 120)):
-                response = flask_app_test_client.post('/api/claude/run',
-                    json={"prompt": "Test"}
-                )
-                assert response.status_code == 408
+            response = flask_app_test_client.post('/api/claude/run',
+                json={"prompt": "Test"}
+            )
+            assert response.status_code == 408
 
 
 class TestClaudeGenerateSkillEndpoint:
     """Tests for POST /api/claude/generate-skill endpoint in app."""
 
-    def test_generates_skill(self, flask_app_test_client):
+    def test_generates_skill(self, flask_app_test_client, mock_popen):
         """Test skill generation."""
-        with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value.stdout = """---
+        import io
+        mock_popen.return_value.stdout = io.StringIO("""---
 name: generated
 description: Generated skill
 ---
-# Generated"""
-                mock_run.return_value.stderr = ""
-                response = flask_app_test_client.post('/api/claude/generate-skill',
-                    json={"idea": "A test skill"}
-                )
-                assert response.status_code == 200
-                data = response.get_json()
-                assert data["success"] is True
-                assert "skill" in data
+# Generated""")
+        with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
+            response = flask_app_test_client.post('/api/claude/generate-skill',
+                json={"idea": "A test skill"}
+            )
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["success"] is True
+            assert "skill" in data
 
     def test_requires_idea(self, flask_app_test_client):
         """Test that idea is required."""
@@ -0,0 +1,829 @@
+# test_core.py - Tests for the shared core module
+import pytest
+import json
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import skills, utils
+
+
+class TestSanitizeName:
+    """Tests for sanitize_name function."""
+
+    def test_replaces_ascii_punctuation(self):
+        """Test that ASCII characters outside [a-z0-9-] become hyphens."""
+        assert utils.sanitize_name("  My_Skill@v2! ") == "my-skill-v2"
+
+    def test_replaces_non_ascii(self):
+        """Test that non-ASCII characters are replaced too."""
+        assert utils.sanitize_name("Café Über") == "caf---ber"
+
+
+class TestFrontmatter:
+    """Tests for frontmatter field extraction."""
+
+    def test_extracts_description(self):
+        """Test that the description line is extracted and stripped."""
+        content = "---\nname: demo\ndescription:  Does things \n---\n# Demo\n"
+        assert utils.extract_description_from_frontmatter(content) == "Does things"
+
+    def test_matches_parse_frontmatter(self):
+        """Test agreement with parse_frontmatter, including repeated keys."""
+        content = "---\r\ndescription: first\r\n  description : last\r\n---\r\nbody"
+        expected = utils.parse_frontmatter(content)[0]["description"]
+        assert utils.extract_description_from_frontmatter(content) == expected == "last"
+
+    def test_no_frontmatter(self):
+        """Test that content without frontmatter has no description."""
+        assert utils.extract_description_from_frontmatter("# Title\ndescription: no") is None
+
+    def test_extracts_name_and_description(self):
+        """Test extracting both fields from generated skill output."""
+        content = "---\nname: my-skill\ndescription: One line\n---\n\n# My Skill"
+        assert utils.extract_name_and_description(content) == {
+            "name": "my-skill",
+            "description": "One line",
+        }
+
+    def test_parse_frontmatter_fields_and_body(self):
+        """Test that colon lines become fields, split at the first colon."""
+        content = "---\nname: demo\nurl: http://x\nno colon here\n---\n\n# Body\n"
+        assert utils.parse_frontmatter(content) == (
+            {"name": "demo", "url": "http://x"},
+            "# Body",
+        )
+
+
+class TestListAllSkills:
+    """Tests for list_all_skills function."""
+
+    def test_parallel_listing_matches_serial(self, core_skills_dir, monkeypatch):
+        """Test that the thread-pool path returns the same skills in the same order."""
+        for i in range(12):
+            skill_dir = core_skills_dir / f"skill-{i}"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(f"---\ndescription: Skill {i}\n---\n")
+
+        monkeypatch.setattr(skills, "LIST_PARALLEL_MIN", 1000)
+        serial = skills.list_all_skills()
+        monkeypatch.setattr(skills, "LIST_PARALLEL_MIN", 1)
+        assert skills.list_all_skills() == serial
+        assert {s["description"] for s in serial} == {f"Skill {i}" for i in range(12)}
+
+    def test_lists_skill_with_metadata(self, core_skills_dir, sample_skill):
+        """Test that metadata is loaded and content only on request."""
+        result = skills.list_all_skills()
+        assert len(result) == 1
+        assert result[0]["name"] == "test-skill"
+        assert result[0]["tags"] == ["testing", "unit-test", "example"]
+        assert "content" not in result[0]
+        assert "# Test Skill" in skills.list_all_skills(include_content=True)[0]["content"]
+
+    def test_skips_skill_md_when_meta_has_description(self, core_skills_dir, sample_skill):
+        """Test that SKILL.md is not read when _meta.json has a description."""
+        with patch.object(skills, "_head_description") as mock_head:
+            result = skills.list_all_skills()
+        mock_head.assert_not_called()
+        assert result[0]["description"] == "A test skill for unit testing"
+
+    def test_reads_description_from_skill_md_head(self, core_skills_dir, sample_skill):
+        """Test that a missing description falls back to the frontmatter."""
+        (sample_skill / "_meta.json").write_text(json.dumps({"name": "test-skill"}), encoding="utf-8")
+        (sample_skill / "SKILL.md").write_text(
+            "---\ndescription: From frontmatter\n---\n" + "x" * 10000, encoding="utf-8"
+        )
+        result = skills.list_all_skills()
+        assert result[0]["description"] == "From frontmatter"
+
+    def test_reads_long_frontmatter_to_its_end(self, core_skills_dir, sample_skill):
+        """Test that frontmatter longer than one read chunk is still parsed."""
+        (sample_skill / "_meta.json").write_text(json.dumps({"name": "test-skill"}), encoding="utf-8")
+        padding = "".join(f"key{i}: value\n" for i in range(1000))
+        (sample_skill / "SKILL.md").write_text(
+            f"---\n{padding}description: Late field\n---\n# Body\n", encoding="utf-8"
+        )
+        result = skills.list_all_skills()
+        assert result[0]["description"] == "Late field"
+
+    def test_counts_files_and_directories(self, core_skills_dir, sample_skill):
+        """Test that file_count matches the entries below the skill folder."""
+        result = skills.list_all_skills()
+        assert result[0]["file_count"] == len(list(sample_skill.rglob("*")))
+
+    def test_reuses_parsed_files_when_unchanged(self, core_skills_dir, sample_skill):
+        """Test that unchanged files are not parsed again."""
+        skills.list_all_skills()
+        with patch.object(skills, "_parse_json") as mock_loads:
+            skills.list_all_skills()
+        mock_loads.assert_not_called()
+
+    def test_rereads_modified_metadata(self, core_skills_dir, sample_skill):
+        """Test that edited _meta.json files are picked up."""
+        skills.list_all_skills()
+        meta_file = sample_skill / "_meta.json"
+        meta = json.loads(meta_file.read_text())
+        meta["description"] = "Changed on disk"
+        meta_file.write_text(json.dumps(meta))
+        assert skills.list_all_skills()[0]["description"] == "Changed on disk"
+
+
+class TestGetSkillByName:
+    """Tests for get_skill_by_name function."""
+
+    def test_lists_relative_file_paths(self, core_skills_dir, sample_skill):
+        """Test that only files are listed, relative to the skill folder."""
+        skill_data, error = skills.get_skill_by_name("test-skill")
+        assert error is None
+        files = {Path(f).as_posix() for f in skill_data["files"]}
+        assert files == {"SKILL.md", "_meta.json", "references/advanced.md", "scripts/helper.py"}
+
+    def test_update_is_visible_immediately(self, core_skills_dir, sample_skill):
+        """Test that writes through update_skill invalidate cached files."""
+        skills.get_skill_by_name("test-skill")
+        skills.update_skill("test-skill", description="Updated", content="New body")
+        skill_data, _ = skills.get_skill_by_name("test-skill")
+        assert skill_data["description"] == "Updated"
+        assert "New body" in skill_data["content"]
+
+
+class TestCompression:
+    """Tests for gzip compression of JSON responses."""
+
+    @pytest.fixture
+    def client(self):
+        from flask import Flask, jsonify
+        from core.compress import configure_compression
+        from core.json_provider import configure_json_provider, stream_json_list
+
+        app = Flask(__name__)
+        configure_json_provider(app)
+        configure_compression(app)
+
+        @app.route("/big")
+        def big():
+            return jsonify({"items": ["skill"] * 500})
+
+        @app.route("/small")
+        def small():
+            return jsonify({"ok": True})
+
+        @app.route("/stream")
+        def stream():
+            return stream_json_list("items", iter([{"name": "a"}, {"name": "b"}]))
+
+        return app.test_client()
+
+    def test_gzips_large_json(self, client):
+        """Test that large JSON bodies are gzipped for clients that accept it."""
+        import gzip
+
+        response = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(gzip.decompress(response.get_data())) == {"items": ["skill"] * 500}
+
+    def test_gzips_streamed_list(self, client):
+        """Test that a streamed JSON list is compressed as it streams."""
+        import gzip
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.get_data())) == {"items": [{"name": "a"}, {"name": "b"}]}
+
+    def test_leaves_small_or_unrequested_bodies(self, client):
+        """Test that tiny bodies and clients without gzip get plain JSON."""
+        assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        response = client.get("/big")
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == {"items": ["skill"] * 500}
+
+
+class TestRateLimiter:
+    """Tests for the per-client rate limiter."""
+
+    def test_limits_each_client_within_window(self, monkeypatch):
+        """Test that calls past the limit are refused until the window slides."""
+        from core import ratelimit
+
+        now = [1000.0]
+        monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+        limiter = ratelimit.RateLimiter(limit=2, window=60)
+
+        assert limiter.allow("a") and limiter.allow("a")
+        assert not limiter.allow("a")
+        assert limiter.allow("b")
+
+        now[0] += 60
+        assert limiter.allow("a")
+
+    def test_forgets_idle_clients(self, monkeypatch):
+        """Test that clients with only expired calls are dropped from memory."""
+        from core import ratelimit
+
+        now = [1000.0]
+        monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+        limiter = ratelimit.RateLimiter(limit=2, window=60)
+        limiter.allow("a")
+
+        now[0] += 60
+        limiter.allow("b")
+        assert set(limiter._hits) == {"b"}
+
+    def test_view_returns_429(self):
+        """Test that a decorated view answers 429 once the caller is over the limit."""
+        from flask import Flask
+        from core.ratelimit import RateLimiter
+
+        app = Flask(__name__)
+        limiter = RateLimiter(limit=1, window=60)
+        app.add_url_rule("/run", "run", limiter(lambda: "ok"), methods=["POST"])
+        client = app.test_client()
+
+        assert client.post("/run").status_code == 200
+        response = client.post("/run")
+        assert response.status_code == 429
+        assert "error" in response.get_json()
+
+
+class TestSendCachedPage:
+    """Tests for serving the web UI from memory."""
+
+    def test_serves_and_picks_up_edits(self, tmp_path):
+        """Test 200/304 handling and that a changed file is re-read."""
+        import os
+        from flask import Flask
+        from core.static import send_cached_page
+
+        page = tmp_path / "page.html"
+        page.write_text("<p>one</p>")
+        app = Flask(__name__)
+
+        @app.route("/")
+        def index():
+            return send_cached_page(str(tmp_path), "page.html", max_age=60)
+
+        client = app.test_client()
+        first = client.get("/")
+        assert first.get_data() == b"<p>one</p>"
+        assert first.mimetype == "text/html"
+        assert "max-age=60" in first.headers["Cache-Control"]
+        assert client.get("/", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+        page.write_text("<p>two!</p>")
+        os.utime(page, ns=(0, page.stat().st_mtime_ns + 1_000_000))
+        second = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 200
+        assert second.get_data() == b"<p>two!</p>"
+
+    def test_missing_file_is_404(self, tmp_path):
+        """Test that a missing page is a 404, not a server error."""
+        from flask import Flask
+        from core.static import send_cached_page
+
+        app = Flask(__name__)
+        app.add_url_rule("/", "index", lambda: send_cached_page(str(tmp_path), "nope.html", max_age=60))
+        assert app.test_client().get("/").status_code == 404
+
+
+class TestJsonProvider:
+    """Tests for the orjson-backed Flask JSON provider."""
+
+    def test_jsonify_round_trip(self):
+        """Test that responses encode like Flask's default provider."""
+        pytest.importorskip("orjson")
+        from flask import Flask
+        from core.json_provider import configure_json_provider
+
+        app = Flask(__name__)
+        configure_json_provider(app)
+        with app.app_context():
+            body = app.json.dumps({"b": 1, "a": "café", 3: None})
+        assert body == '{"3":null,"a":"café","b":1}'
+        assert app.json.loads(body)["a"] == "café"
+
+    def test_jsonify_matches_default_provider(self):
+        """Test that jsonify bodies match Flask's own provider byte for byte."""
+        pytest.importorskip("orjson")
+        from flask import Flask, jsonify
+        from core.json_provider import configure_json_provider
+
+        payload = {"name": "demo", "tags": ["a", "b"], "count": 2}
+        default_app = Flask(__name__)
+        app = Flask(__name__)
+        configure_json_provider(app)
+        with default_app.app_context():
+            expected = jsonify(payload).get_data()
+        with app.app_context():
+            response = jsonify(payload)
+        assert response.mimetype == "application/json"
+        assert response.get_data() == expected
+
+    def test_stream_json_list(self):
+        """Test that a streamed list decodes to the same document as jsonify."""
+        from flask import Flask
+        from core.json_provider import configure_json_provider, stream_json_list
+
+        app = Flask(__name__)
+        configure_json_provider(app)
+        items = [{"name": "a"}, {"name": "b", "tags": ["x"]}]
+
+        @app.route("/items")
+        def items_route():
+            return stream_json_list("items", iter(items))
+
+        response = app.test_client().get("/items")
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"items": items}
+
+    def test_error_response_matches_jsonify(self):
+        """Test that cached error bodies match what jsonify would send."""
+        from flask import Flask, jsonify
+        from core.json_provider import configure_json_provider, error_response
+
+        app = Flask(__name__)
+        configure_json_provider(app)
+        with app.app_context():
+            expected = jsonify({"error": "Skill 'x' not found"})
+            response = error_response("Skill 'x' not found", 404)
+        assert response.status_code == 404
+        assert response.mimetype == "application/json"
+        assert response.get_json() == expected.get_json()
+
+
+class TestFindClaudeCli:
+    """Tests for find_claude_cli function."""
+
+    def test_result_is_cached(self, mock_claude_cli):
+        """Test that PATH is only searched once until the cache is cleared."""
+        from core.config import find_claude_cli
+
+        assert find_claude_cli() == "/usr/bin/claude"
+        assert find_claude_cli() == "/usr/bin/claude"
+        assert mock_claude_cli.call_count == 1
+
+        find_claude_cli.cache_clear()
+        find_claude_cli()
+        assert mock_claude_cli.call_count == 2
+
+
+class TestGetClaudeStatus:
+    """Tests for get_claude_status function."""
+
+    def test_version_is_cached(self, mock_claude_cli, mock_subprocess):
+        """Test that `claude --version` runs once until the cache is cleared."""
+        from core import claude_cli
+
+        status = claude_cli.get_claude_status()
+        claude_cli.get_claude_status()
+        assert status == {"available": True, "path": "/usr/bin/claude", "version": "Mock Claude response"}
+        assert mock_subprocess.call_count == 1
+
+        claude_cli.clear_claude_cli_cache()
+        claude_cli.get_claude_status()
+        assert mock_subprocess.call_count == 2
+
+
+class TestRunClaudePrompt:
+    """Tests for run_claude_prompt function."""
+
+    def test_keeps_head_of_long_output(self, core_skills_dir, mock_claude_cli, mock_popen, monkeypatch):
+        """Test that only the first MAX_OUTPUT_CHARS of each stream are kept, and flagged."""
+        import io
+        from core import claude_cli
+
+        monkeypatch.setattr(claude_cli, "MAX_OUTPUT_CHARS", 10)
+        monkeypatch.setattr(claude_cli, "OUTPUT_CHUNK_CHARS", 4)
+        mock_popen.return_value.stdout = io.StringIO("0123456789abcdefghij")
+        mock_popen.return_value.stderr = io.StringIO("warn")
+
+        result, error = claude_cli.run_claude_prompt("hello")
+        assert error is None
+        assert result == {
+            "success": True, "stdout": "0123456789", "stderr": "warn", "returncode": 0, "truncated": True,
+        }
+
+    def test_decodes_output_as_utf8(self, core_skills_dir, mock_claude_cli, mock_popen):
+        """Test that CLI output is decoded as UTF-8 whatever the locale."""
+        from core import claude_cli
+
+        claude_cli.run_claude_prompt("hello")
+        kwargs = mock_popen.call_args.kwargs
+        assert (kwargs["encoding"], kwargs["errors"]) == ("utf-8", "replace")
+
+
+class TestRunSlots:
+    """Tests for the cap on concurrent Claude CLI processes."""
+
+    def test_waits_for_a_free_slot(self, mock_popen, monkeypatch):
+        """Test that no CLI is started while every slot is taken."""
+        import subprocess
+        import threading
+        from core import claude_cli
+
+        monkeypatch.setattr(claude_cli, "_RUN_SLOTS", threading.BoundedSemaphore(1))
+        claude_cli._RUN_SLOTS.acquire()
+        with pytest.raises(subprocess.TimeoutExpired):
+            claude_cli._run_cli(["claude", "-p", "hi"], timeout=0.01)
+        mock_popen.assert_not_called()
+
+        claude_cli._RUN_SLOTS.release()
+        assert claude_cli._run_cli(["claude", "-p", "hi"], timeout=1) == (0, "Mock Claude response", "", False)
+        # The slot is free again afterwards
+        assert claude_cli._RUN_SLOTS.acquire(timeout=0)
+
+    def test_stream_holds_slot_until_exit(self, mock_claude_cli, core_skills_dir, mock_popen, monkeypatch):
+        """Test that a streamed run keeps its slot until the process exits."""
+        import io
+        import threading
+        from core import claude_cli
+
+        slots = threading.BoundedSemaphore(1)
+        monkeypatch.setattr(claude_cli, "_RUN_SLOTS", slots)
+        exited = threading.Event()
+        process = mock_popen.return_value
+        process.stdout = io.StringIO("line\n")
+        process.wait.side_effect = lambda *args, **kwargs: exited.wait()
+
+        output, error = claude_cli.stream_claude_prompt("hello")
+        assert error is None
+        assert not slots.acquire(timeout=0.05)
+
+        exited.set()
+        assert list(output) == ["line\n"]
+        assert slots.acquire(timeout=1)
+
+
+class TestImproveSkillWithClaude:
+    """Tests for improve_skill_with_claude function."""
+
+    def test_kills_cli_on_timeout(self, core_skills_dir, sample_skill, mock_claude_cli, mock_popen):
+        """Test that a CLI still running at the timeout is killed and reported."""
+        import subprocess
+        from core import claude_cli
+
+        mock_popen.return_value.wait.side_effect = [subprocess.TimeoutExpired("claude", 180), -9]
+        result, error = claude_cli.improve_skill_with_claude("test-skill", "Add examples")
+        assert result is None
+        assert error == "Timeout"
+        mock_popen.return_value.kill.assert_called_once()
+
+    def test_rejects_truncated_output(self, core_skills_dir, sample_skill, mock_claude_cli, mock_popen, monkeypatch):
+        """Test that output cut off at MAX_OUTPUT_CHARS is an error, not a partial skill."""
+        import io
+        from core import claude_cli
+
+        monkeypatch.setattr(claude_cli, "MAX_OUTPUT_CHARS", 10)
+        mock_popen.return_value.stdout = io.StringIO("---\nname: long\n---\n")
+        result, error = claude_cli.improve_skill_with_claude("test-skill", "Add examples")
+        assert result is None
+        assert error == claude_cli.OUTPUT_TOO_LONG
+
+
+class TestStreamClaudePrompt:
+    """Tests for stream_claude_prompt function."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the fake CLI")
+    def test_streams_cli_output(self, core_skills_dir, tmp_path):
+        """Test that output lines are yielded as the CLI writes them."""
+        fake_cli = tmp_path / "claude"
+        fake_cli.write_text("#!/bin/sh\necho first\necho second\n")
+        fake_cli.chmod(0o755)
+        from core import claude_cli
+
+        with patch.object(claude_cli, "find_claude_cli", return_value=str(fake_cli)):
+            output, error = claude_cli.stream_claude_prompt("hello")
+        assert error is None
+        assert list(output) == ["first\n", "second\n"]
+
+    def test_cli_not_found(self):
+        """Test the error when no CLI is installed."""
+        from core import claude_cli
+
+        with patch.object(claude_cli, "find_claude_cli", return_value=None):
+            output, error = claude_cli.stream_claude_prompt("hello")
+        assert output is None
+        assert error == "Claude Code CLI not found"
+
+
+class TestReadWhole:
+    """Tests for _read_whole."""
+
+    @pytest.mark.parametrize("data", [b"", b"x", bytes(range(256)) * 64])
+    def test_reads_exact_file(self, tmp_path, data):
+        """Test that the whole file is returned for any size, including empty."""
+        path = tmp_path / "f.bin"
+        path.write_bytes(data)
+        assert skills._read_whole(str(path), len(data)) == data
+
+    def test_reads_past_stale_size(self, tmp_path):
+        """Test that bytes appended after the stat are still read."""
+        path = tmp_path / "f.bin"
+        path.write_bytes(b"0123456789")
+        assert skills._read_whole(str(path), 3) == b"0123456789"
+
+
+class TestUpdateSkill:
+    """Tests for update_skill function."""
+
+    def test_keeps_other_meta_fields(self, core_skills_dir, sample_skill):
+        """Test that unrelated _meta.json fields survive an update."""
+        skills.update_skill("test-skill", description="Changed", content="Body")
+        meta = json.loads((sample_skill / "_meta.json").read_text(encoding="utf-8"))
+        assert meta["description"] == "Changed"
+        assert meta["tags"] == ["testing", "unit-test", "example"]
+        assert meta["sub_skills"][0]["name"] == "advanced-testing"
+
+    def test_rebuilds_invalid_meta(self, core_skills_dir, sample_skill_invalid_meta):
+        """Test that an unparseable _meta.json is replaced."""
+        result, error = skills.update_skill("invalid-skill", description="Fixed", content="Body")
+        assert error is None
+        meta = json.loads((sample_skill_invalid_meta / "_meta.json").read_text(encoding="utf-8"))
+        assert meta == {"name": "invalid-skill", "description": "Fixed", "tags": []}
+
+    def test_does_not_mutate_cached_meta(self, core_skills_dir, sample_skill, monkeypatch):
+        """Test that updating from the cached _meta.json leaves the cached value intact."""
+        cached = skills._read_cached(sample_skill / "_meta.json", skills._parse_json)
+        monkeypatch.setattr(skills, "_atomic_write_bytes", lambda path, data: None)
+        monkeypatch.setattr(skills, "_atomic_write_text", lambda path, text: None)
+
+        skills.update_skill("test-skill", description="Changed", content="Body")
+        assert cached["description"] == "A test skill for unit testing"
+
+
+class TestDeleteSkill:
+    """Tests for delete_skill function."""
+
+    def test_removes_skill_and_trash(self, core_skills_dir, sample_skill, monkeypatch):
+        """Test that the skill disappears at once and its files are removed."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(skills, "_DELETE_EXECUTOR", executor)
+        result, error = skills.delete_skill("test-skill")
+        assert error is None
+        assert result == {"success": True, "name": "test-skill"}
+        assert not sample_skill.exists()
+
+        executor.shutdown(wait=True)
+        assert not list((core_skills_dir / skills.TRASH_DIR_NAME).iterdir())
+        assert not list(core_skills_dir.parent.glob(".trash*"))
+        assert skills.list_all_skills() == []
+
+    def test_purge_trash_removes_leftovers(self, core_skills_dir, monkeypatch):
+        """Test that only leftovers inside the skills directory are cleaned up."""
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(skills, "_DELETE_EXECUTOR", executor)
+        leftover = core_skills_dir / skills.TRASH_DIR_NAME / "old-skill-0123"
+        (leftover / "scripts").mkdir(parents=True)
+        (leftover / "SKILL.md").write_text("# Old")
+        staging = core_skills_dir / skills.STAGING_DIR_NAME
+        abandoned = staging / "import-old"
+        in_progress = staging / "import-new"
+        abandoned.mkdir(parents=True)
+        in_progress.mkdir()
+        stale = abandoned.stat().st_mtime - skills.STAGING_MAX_AGE - 60
+        os.utime(abandoned, (stale, stale))
+        outside = core_skills_dir.parent / ".trash-unrelated"
+        outside.mkdir()
+
+        skills.purge_trash()
+        executor.shutdown(wait=True)
+        assert not leftover.exists()
+        assert not abandoned.exists()
+        assert in_progress.exists()
+        assert outside.exists()
+        assert core_skills_dir.exists()
+
+    def test_missing_skill(self, core_skills_dir):
+        """Test that deleting an unknown skill reports an error."""
+        result, error = skills.delete_skill("nope")
+        assert result is None
+        assert "not found" in error
+
+
+class TestImportFilesJson:
+    """Tests for import_files_json function."""
+
+    def test_writes_text_and_base64_files(self, core_skills_dir):
+        """Test that files land in nested folders with no temp files left behind."""
+        import base64
+
+        result, error = skills.import_files_json("uploaded", [
+            {"path": "SKILL.md", "content": "---\ndescription: Uploaded\n---\n"},
+            {"path": "references/a.md", "content": "# A"},
+            {"path": "references/b.bin", "content": base64.b64encode(b"\x00\x01").decode(), "base64": True},
+            {"path": "../escape.md", "content": "nope"},
+        ])
+        assert error is None
+        assert result["files_imported"] == ["SKILL.md", "references/a.md", "references/b.bin"]
+
+        skill_dir = core_skills_dir / "uploaded"
+        assert (skill_dir / "references" / "a.md").read_text() == "# A"
+        assert (skill_dir / "references" / "b.bin").read_bytes() == b"\x00\x01"
+        assert json.loads((skill_dir / "_meta.json").read_text())["description"] == "Uploaded"
+        assert not list(skill_dir.rglob("*.tmp"))
+
+    def test_rejects_malformed_base64_before_writing(self, core_skills_dir):
+        """Test that a bad base64 entry fails the import without creating the skill."""
+        result, error = skills.import_files_json("broken", [
+            {"path": "SKILL.md", "content": "# Broken"},
+            {"path": "data.bin", "content": "abc", "base64": True},
+        ])
+        assert result is None
+        assert "data.bin" in error
+        assert not (core_skills_dir / "broken").exists()
+
+    def test_streams_large_base64_in_chunks(self, core_skills_dir, monkeypatch):
+        """Test that payloads over the stream threshold decode chunk by chunk."""
+        import base64
+
+        monkeypatch.setattr(skills, "BASE64_STREAM_MIN", 16)
+        monkeypatch.setattr(skills, "BASE64_CHUNK_CHARS", 8)
+        data = bytes(range(256)) * 3
+
+        result, error = skills.import_files_json("large", [
+            {"path": "data.bin", "content": base64.b64encode(data).decode(), "base64": True},
+        ])
+        assert error is None
+        assert (core_skills_dir / "large" / "data.bin").read_bytes() == data
+
+    def test_streamed_base64_skips_non_alphabet_characters(self, core_skills_dir, monkeypatch):
+        """Test that characters outside the alphabet do not shift chunk alignment."""
+        import base64
+
+        monkeypatch.setattr(skills, "BASE64_STREAM_MIN", 16)
+        monkeypatch.setattr(skills, "BASE64_CHUNK_CHARS", 8)
+        data = bytes(range(256)) * 3
+        encoded = base64.b64encode(data).decode().replace("A", "A-", 5)
+
+        result, error = skills.import_files_json("wrapped", [
+            {"path": "data.bin", "content": encoded, "base64": True},
+        ])
+        assert error is None
+        assert (core_skills_dir / "wrapped" / "data.bin").read_bytes() == data
+
+    def test_failed_streamed_import_leaves_existing_skill_untouched(self, core_skills_dir, sample_skill, monkeypatch):
+        """Test that files are only moved into the skill once every write succeeded."""
+        monkeypatch.setattr(skills, "BASE64_STREAM_MIN", 16)
+        original = (sample_skill / "SKILL.md").read_text()
+
+        result, error = skills.import_files_json("test-skill", [
+            {"path": "SKILL.md", "content": "# Replaced"},
+            {"path": "new.md", "content": "# New"},
+            {"path": "data.bin", "content": "QUJD" * 8 + "Q", "base64": True},
+        ])
+        assert result is None
+        assert error == "Invalid base64 content"
+        assert (sample_skill / "SKILL.md").read_text() == original
+        assert not (sample_skill / "new.md").exists()
+
+    def test_adds_files_to_existing_skill(self, core_skills_dir, sample_skill):
+        """Test that importing into an existing skill keeps its other files."""
+        result, error = skills.import_files_json("test-skill", [
+            {"path": "references/extra.md", "content": "# Extra"},
+        ])
+        assert error is None
+        assert (sample_skill / "references" / "extra.md").read_text() == "# Extra"
+        assert (sample_skill / "references" / "advanced.md").exists()
+        assert not list((core_skills_dir / skills.STAGING_DIR_NAME).glob("import-*/references/extra.md"))
+
+
+class TestBrowseSkillsDirectory:
+    """Tests for browse_skills_directory function."""
+
+    def test_lists_root_and_nested(self, core_skills_dir, sample_skill):
+        """Test listing the skills root and a folder inside a skill."""
+        from core import browse
+
+        root, error = browse.browse_skills_directory("")
+        assert error is None
+        assert root["dirs"] == [{"name": "test-skill", "path": "test-skill", "is_skill": True}]
+
+        nested, _ = browse.browse_skills_directory("test-skill")
+        assert [d["name"] for d in nested["dirs"]] == ["references", "scripts"]
+        assert [Path(f["path"]).as_posix() for f in nested["files"]] == ["test-skill/SKILL.md", "test-skill/_meta.json"]
+        assert nested["parent"] == ""
+
+    def test_caps_listing(self, core_skills_dir, monkeypatch):
+        """Test that each list keeps its alphabetically first entries, sorted."""
+        from core import browse
+
+        monkeypatch.setattr(browse, "MAX_LISTED_ENTRIES", 3)
+        for i in range(6):
+            (core_skills_dir / f"file{i}.md").write_text("x")
+            (core_skills_dir / f"dir{i}").mkdir()
+
+        result, _ = browse.browse_skills_directory("")
+        assert [f["name"] for f in result["files"]] == ["file0.md", "file1.md", "file2.md"]
+        assert [d["name"] for d in result["dirs"]] == ["dir0", "dir1", "dir2"]
+
+    def test_rejects_sibling_with_shared_prefix(self, core_skills_dir):
+        """Test that a sibling like "skills2" is not treated as inside "skills"."""
+        from core import browse
+
+        sibling = core_skills_dir.parent / f"{core_skills_dir.name}2"
+        sibling.mkdir()
+        (core_skills_dir / "link").symlink_to(sibling, target_is_directory=True)
+        result, error = browse.browse_skills_directory("link")
+        assert result is None
+        assert "Access denied" in error
+
+
+class TestSafeJoin:
+    """Tests for _safe_join path traversal guard."""
+
+    @pytest.mark.parametrize("rel", ["../other/x.md", "..\\..\\x.md", "a/../../x.md", ".", ""])
+    def test_rejects_paths_outside_base(self, tmp_path, rel):
+        """Test that paths escaping (or equal to) the base are rejected."""
+        assert skills._safe_join(str(tmp_path), rel) is None
+
+    def test_rejects_absolute_paths(self, tmp_path):
+        """Test that absolute paths are rejected."""
+        assert skills._safe_join(str(tmp_path / "skill"), str(tmp_path / "elsewhere.md")) is None
+
+    def test_normalizes_inside_paths(self, tmp_path):
+        """Test that safe paths are normalized and joined onto the base."""
+        expected = str(tmp_path / "refs" / "b.md")
+        assert skills._safe_join(str(tmp_path), "refs\\a/../b.md") == expected
+
+
+class TestImportFolder:
+    """Tests for import_folder function."""
+
+    def test_copies_folder_tree(self, core_skills_dir, tmp_path):
+        """Test that nested files are copied byte for byte."""
+        source = tmp_path / "source-skill"
+        (source / "references").mkdir(parents=True)
+        (source / "SKILL.md").write_text("---\ndescription: From disk\n---\n")
+        (source / "references" / "data.bin").write_bytes(bytes(range(256)) * 100)
+
+        result, error = skills.import_folder(str(source))
+        assert error is None
+        dest = core_skills_dir / "source-skill"
+        assert (dest / "references" / "data.bin").read_bytes() == bytes(range(256)) * 100
+        assert json.loads((dest / "_meta.json").read_text())["description"] == "From disk"
+        assert result["files_imported"] == 4
+
+    def test_failed_import_leaves_no_partial_skill(self, core_skills_dir, tmp_path, monkeypatch):
+        """Test that a failure after copying moves the partial folder out of skills/."""
+        source = tmp_path / "half"
+        source.mkdir()
+        (source / "SKILL.md").write_text("# Half")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(skills, "_atomic_write_bytes", fail)
+        result, error = skills.import_folder(str(source))
+        assert result is None
+        assert error == "disk full"
+        assert not (core_skills_dir / "half").exists()
+
+    def test_placeholder_skill_md(self, core_skills_dir, tmp_path):
+        """Test that a folder without SKILL.md gets one and a default description."""
+        source = tmp_path / "bare"
+        source.mkdir()
+        (source / "notes.txt").write_text("hello")
+
+        result, error = skills.import_folder(str(source))
+        assert error is None
+        dest = core_skills_dir / "bare"
+        assert (dest / "SKILL.md").read_text().startswith("---\nname: bare\n")
+        assert json.loads((dest / "_meta.json").read_text())["description"] == "Imported skill"
+        assert result["files_imported"] == 3
+
+
+class TestSkillsEtag:
+    """Tests for skills_etag function."""
+
+    def test_stable_until_a_skill_changes(self, core_skills_dir, sample_skill):
+        """Test that the ETag only changes when skill files do."""
+        etag = skills.skills_etag()
+        assert skills.skills_etag() == etag
+
+        skills.update_skill("test-skill", description="Changed", content="Body")
+        assert skills.skills_etag() != etag
+
+    def test_changes_when_skill_deleted(self, core_skills_dir, multiple_skills):
+        """Test that removing a skill changes the ETag."""
+        etag = skills.skills_etag()
+        skills.delete_skill("forms")
+        assert skills.skills_etag() != etag
+
+    def test_changes_when_nested_file_added(self, core_skills_dir, sample_skill):
+        """Test that an addition below a subfolder (a new file_count) changes the ETag."""
+        import os
+
+        before = skills.skills_etag()
+        references = sample_skill / "references"
+        (references / "new.md").write_text("# New")
+        st = os.stat(references)
+        os.utime(references, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert skills.skills_etag() != before
@@ -0,0 +1,114 @@
+# test_creation_station_db.py - Tests for the Creation Station SQLite helpers
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import creation_station_db as db
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create an initialized database in a temporary directory."""
+    path = tmp_path / "creation_station.db"
+    db.init_db(path)
+    return path
+
+
+class TestConnect:
+    """Tests for connect and init_db."""
+
+    def test_uses_wal_journal(self, db_path):
+        """Test that init_db switches the database to WAL."""
+        with db.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_applies_connection_pragmas(self, db_path):
+        """Test that every connection gets the tuned settings."""
+        with db.connect(db_path) as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.isolation_level == "IMMEDIATE"
+
+
+class TestVersions:
+    """Tests for creating and reading skill versions."""
+
+    def test_create_and_fetch_version(self, db_path):
+        """Test that files written to a version can be read back."""
+        with db.connect(db_path) as conn:
+            skill_id = db.upsert_skill(conn, "test-skill")
+            version_id = db.create_version(
+                conn,
+                skill_id=skill_id,
+                files=[
+                    db.SkillFile("SKILL.md", "# Test", False),
+                    db.SkillFile("scripts/tool.bin", b"\x00\x01", True),
+                ],
+                status="draft",
+            )
+            files = [db.decode_skill_file(row) for row in db.fetch_version_files(conn, version_id)]
+
+        assert [f.path for f in files] == ["SKILL.md", "scripts/tool.bin"]
+        assert files[0].content == "# Test"
+        assert files[1].content == b"\x00\x01"
+
+
+class TestLoadSkillFiles:
+    """Tests for load_skill_files."""
+
+    def test_loads_nested_text_and_binary_files(self, sample_skill):
+        """Test that every file is found with a forward-slash relative path."""
+        (sample_skill / "scripts" / "data.bin").write_bytes(b"\x00\xff")
+        files = {f.path: f for f in db.load_skill_files(sample_skill)}
+
+        assert set(files) == {
+            "SKILL.md", "_meta.json", "references/advanced.md",
+            "scripts/helper.py", "scripts/data.bin",
+        }
+        assert not files["SKILL.md"].is_binary
+        assert files["scripts/data.bin"].content == b"\x00\xff"
+
+
+class TestIndexes:
+    """Tests for the indexes created by init_db."""
+
+    def test_version_file_lookup_uses_index(self, db_path):
+        """Test that fetching a version's files does not scan skill_files."""
+        with db.connect(db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT path FROM skill_files "
+                "WHERE skill_version_id = ? ORDER BY path",
+                (1,),
+            ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_skill_files_version_path" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_runs_listing_uses_index(self, db_path):
+        """Test that newest-first run listings need no sort."""
+        with db.connect(db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM runs ORDER BY created_at DESC LIMIT 20"
+            ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_runs_created_at" in details
+
+
+class TestSeedSkillsFromFilesystem:
+    """Tests for seed_skills_from_filesystem."""
+
+    def test_seeds_published_version_once(self, db_path, sample_skill, temp_skills_dir):
+        """Test that each skill gets one published version sharing one timestamp."""
+        db.seed_skills_from_filesystem(temp_skills_dir, db_path)
+        db.seed_skills_from_filesystem(temp_skills_dir, db_path)
+
+        with db.connect(db_path) as conn:
+            skill = conn.execute("SELECT * FROM skills WHERE name = 'test-skill'").fetchone()
+            versions = db.fetch_skill_versions(conn, skill["id"])
+
+        assert len(versions) == 1
+        assert versions[0]["status"] == "published"
+        assert skill["current_published_version_id"] == versions[0]["id"]
+        assert versions[0]["created_at"] == versions[0]["published_at"] == skill["created_at"]
@@ -1,6 +1,7 @@
 # test_server.py - Tests for the MCP Skills Server
 import pytest
 import json
+import shutil
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import patch, MagicMock
@@ -107,7 +108,7 @@ class TestBuildContentIndex:
         assert key in index
         assert index[key]["domain"] == "test-skill"
         assert index[key]["sub_skill"] is None
-        assert "test skill" in index[key]["content"]
+        assert b"test skill" in index[key]["content"]
 
     def test_indexes_references(self, server_module, sample_skill):
         """Test that reference files are indexed."""
@@ -116,14 +117,14 @@ class TestBuildContentIndex:
         assert key in index
         assert index[key]["domain"] == "test-skill"
         assert index[key]["sub_skill"] == "advanced"
-        assert "mocking" in index[key]["content"]
+        assert b"mocking" in index[key]["content"]
 
     def test_content_is_lowercased(self, server_module, sample_skill):
         """Test that indexed content is lowercased for search."""
         index = server_module.build_content_index()
         key = "test-skill:SKILL.md"
         # Original has "Test Skill" but should be lowercase
-        assert "test skill" in index[key]["content"]
+        assert b"test skill" in index[key]["content"]
 
     def test_multiple_skills_indexed(self, server_module, multiple_skills):
         """Test indexing multiple skills."""
@@ -132,6 +133,37 @@ class TestBuildContentIndex:
         assert "forms:SKILL.md" in index
         assert "building:SKILL.md" in index
 
+    def test_reuses_unchanged_content(self, server_module, sample_skill):
+        """Test that unchanged files are not re-read on rebuild."""
+        server_module.build_content_index()
+        with patch.object(server_module, "read_file_bytes") as mock_read:
+            index = server_module.build_content_index()
+        mock_read.assert_not_called()
+        assert b"test skill" in index["test-skill:SKILL.md"]["content"]
+
+    def test_rereads_modified_content(self, server_module, sample_skill):
+        """Test that modified files are re-read on rebuild."""
+        server_module.build_content_index()
+        (sample_skill / "SKILL.md").write_text("# Rewritten Content\n")
+        index = server_module.build_content_index()
+        assert index["test-skill:SKILL.md"]["content"] == b"# rewritten content\n"
+
+    def test_evicts_deleted_files_from_cache(self, server_module, sample_skill):
+        """Test that deleted files are dropped from the content cache."""
+        server_module.build_content_index()
+        ref_file = sample_skill / "references" / "advanced.md"
+        ref_file.unlink()
+        server_module.build_content_index()
+        assert str(ref_file) not in server_module._CONTENT_CACHE
+
+    def test_large_files_are_not_kept_raw(self, server_module, sample_skill, monkeypatch):
+        """Test that files over LARGE_FILE_BYTES are indexed without a raw copy."""
+        monkeypatch.setattr(server_module, "LARGE_FILE_BYTES", 16)
+        index = server_module.build_content_index()
+        entry = index["test-skill:SKILL.md"]
+        assert entry["raw"] is None
+        assert b"test skill" in entry["content"]
+
 
 class TestLoadIndex:
     """Tests for load_index function."""
@@ -171,6 +203,71 @@ class TestLoadIndex:
         assert server_module._CONTENT_INDEX is not None
         assert len(server_module._CONTENT_INDEX) > 0
 
+    def test_precomputes_search_fields(self, server_module, sample_skill):
+        """Test that lowercased search fields are computed at load time."""
+        meta = server_module.load_index()["skills"][0]
+        assert meta["_tags_lc"] == ["testing", "unit-test", "example"]
+        assert meta["sub_skills"][0]["_triggers_lc"] == ["pytest", "unittest", "mock"]
+
+
+class TestReloadSkills:
+    """Tests for incremental reload_skills function."""
+
+    def test_reparses_only_changed_skills(self, server_module, multiple_skills):
+        """Test that unchanged skills keep their parsed metadata."""
+        server_module._INDEX = server_module.load_index()
+        forms_meta = server_module._INDEX["by_name"]["forms"]
+
+        meta_file = multiple_skills / "test-skill" / "_meta.json"
+        meta = json.loads(meta_file.read_text())
+        meta["description"] = "Updated description"
+        meta_file.write_text(json.dumps(meta))
+
+        index = server_module.reload_skills({"test-skill"})
+        assert index["by_name"]["test-skill"]["description"] == "Updated description"
+        assert index["by_name"]["forms"] is forms_meta
+        assert server_module._INDEX is index
+
+    def test_reindexes_changed_content(self, server_module, sample_skill):
+        """Test that a changed file is searchable after an incremental reload."""
+        server_module._INDEX = server_module.load_index()
+        (sample_skill / "references" / "advanced.md").write_text("# Snapshot testing\n")
+
+        server_module.reload_skills({"test-skill"})
+        result = server_module._search_content("snapshot")
+        assert [r["file"] for r in result["results"]] == ["references/advanced.md"]
+        assert server_module._search_content("mocking")["results"] == []
+
+    def test_drops_deleted_skill(self, server_module, multiple_skills):
+        """Test that a removed skill directory disappears from both indexes."""
+        server_module._INDEX = server_module.load_index()
+        shutil.rmtree(multiple_skills / "forms")
+
+        index = server_module.reload_skills({"forms"})
+        assert "forms" not in index["by_name"]
+        assert "forms" not in index["per_skill"]
+        assert all(e["domain"] != "forms" for e in server_module._CONTENT_INDEX.values())
+
+
+class TestReadJsonFile:
+    """Tests for read_json_file function."""
+
+    def test_parses_json(self, server_module, sample_skill):
+        """Test parsing a _meta.json file."""
+        meta = server_module.read_json_file(sample_skill / "_meta.json")
+        assert meta["name"] == "test-skill"
+
+    def test_falls_back_to_stdlib(self, server_module, sample_skill):
+        """Test parsing without orjson installed."""
+        with patch.object(server_module, "orjson", None):
+            meta = server_module.read_json_file(sample_skill / "_meta.json")
+        assert meta["name"] == "test-skill"
+
+    def test_invalid_json_raises_stdlib_error(self, server_module, sample_skill_invalid_meta):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            server_module.read_json_file(sample_skill_invalid_meta / "_meta.json")
+
 
 class TestGetIndex:
     """Tests for get_index function."""
@@ -229,6 +326,35 @@ class TestTrackUsage:
         assert len(server_module._USAGE_STATS["searches"]) == 100
 
 
+class TestIsSafeSkillName:
+    """Tests for is_safe_skill_name function."""
+
+    def test_accepts_plain_names(self, server_module):
+        """Test that letters, digits, hyphens and underscores pass."""
+        assert server_module.is_safe_skill_name("my_skill-2")
+
+    def test_rejects_unsafe_names(self, server_module):
+        """Test that separators, empty names and a trailing newline fail."""
+        for name in ["../etc", "a/b", "", "skill\n", None]:
+            assert not server_module.is_safe_skill_name(name)
+
+
+class TestValidateSkillPath:
+    """Tests for validate_skill_path function."""
+
+    def test_accepts_paths_inside_skills_dir(self, server_module, sample_skill):
+        """Test that a skill folder and its files are accepted."""
+        assert server_module.validate_skill_path(sample_skill)
+        assert server_module.validate_skill_path(sample_skill / "SKILL.md")
+
+    def test_rejects_sibling_with_shared_prefix(self, server_module, temp_skills_dir):
+        """Test that a sibling folder like skills2 is not inside skills."""
+        sibling = temp_skills_dir.parent / (temp_skills_dir.name + "2")
+        sibling.mkdir()
+        assert not server_module.validate_skill_path(sibling)
+        assert not server_module.validate_skill_path(temp_skills_dir / ".." / "elsewhere")
+
+
 class TestCheckForChanges:
     """Tests for check_for_changes function."""
 
@@ -275,6 +401,68 @@ class TestCheckForChanges:
         assert server_module.check_for_changes() is False
 
 
+class TestSkillsChangeHandler:
+    """Tests for the event-driven watcher handler."""
+
+    def test_sets_reload_event_on_change(self, server_module, sample_skill):
+        """Test that write events request a reload of the changed skill."""
+        server_module._RELOAD_EVENT.clear()
+        server_module._CHANGED_SKILLS.clear()
+        event = MagicMock(event_type="modified", src_path=str(sample_skill / "SKILL.md"), dest_path="")
+        server_module.SkillsChangeHandler().on_any_event(event)
+        assert server_module._RELOAD_EVENT.is_set()
+        assert server_module._CHANGED_SKILLS == {"test-skill"}
+        server_module._RELOAD_EVENT.clear()
+        server_module._CHANGED_SKILLS.clear()
+
+    def test_records_both_sides_of_move(self, server_module, temp_skills_dir):
+        """Test that a renamed skill reloads both the old and new names."""
+        server_module._CHANGED_SKILLS.clear()
+        event = MagicMock(
+            event_type="moved",
+            src_path=str(temp_skills_dir / "old-name"),
+            dest_path=str(temp_skills_dir / "new-name"),
+        )
+        server_module.SkillsChangeHandler().on_any_event(event)
+        assert server_module._CHANGED_SKILLS == {"old-name", "new-name"}
+        server_module._RELOAD_EVENT.clear()
+        server_module._CHANGED_SKILLS.clear()
+
+    def test_ignores_read_only_events(self, server_module, sample_skill):
+        """Test that reading files does not trigger a reload."""
+        server_module._RELOAD_EVENT.clear()
+        handler = server_module.SkillsChangeHandler()
+        path = str(sample_skill / "SKILL.md")
+        handler.on_any_event(MagicMock(event_type="opened", src_path=path))
+        handler.on_any_event(MagicMock(event_type="closed_no_write", src_path=path))
+        assert not server_module._RELOAD_EVENT.is_set()
+
+
+class TestEnsureWatcherStarted:
+    """Tests for lazy file watcher startup."""
+
+    def test_starts_watcher_once(self, server_module, monkeypatch):
+        """Test that the watcher is started on first use only."""
+        start = MagicMock(return_value=object())
+        monkeypatch.setattr(server_module, "start_file_watcher", start)
+        monkeypatch.setattr(server_module, "_watcher_thread", None)
+        monkeypatch.setattr(server_module, "WATCH_ENABLED", True)
+
+        server_module.ensure_watcher_started()
+        server_module.ensure_watcher_started()
+        start.assert_called_once()
+
+    def test_respects_watch_disabled(self, server_module, monkeypatch):
+        """Test that SKILLS_WATCH=0 keeps the watcher off."""
+        start = MagicMock()
+        monkeypatch.setattr(server_module, "start_file_watcher", start)
+        monkeypatch.setattr(server_module, "_watcher_thread", None)
+        monkeypatch.setattr(server_module, "WATCH_ENABLED", False)
+
+        server_module.ensure_watcher_started()
+        start.assert_not_called()
+
+
 class TestExtractSnippet:
     """Tests for extract_snippet function."""
 
@@ -314,6 +502,28 @@ class TestExtractSnippet:
         snippet = server_module.extract_snippet(content, "Line", 100)
         assert "\n" not in snippet
 
+    def test_uses_given_match_pos(self, server_module):
+        """Test that a precomputed match position is used without re-searching."""
+        content = "target at start, then padding " + "x" * 100 + " and the end"
+        snippet = server_module.extract_snippet(content, "target", 20, match_pos=len(content) - 3)
+        assert snippet.startswith("...")
+        assert "end" in snippet
+        assert "target" not in snippet
+
+    def test_bytes_content_matches_str_content(self, server_module):
+        """Test that UTF-8 bytes content gives the same snippet as the decoded text."""
+        content = "é" * 80 + "target" + "ü" * 200
+        data = content.encode("utf-8")
+        for query in ("target", "missing"):
+            assert server_module.extract_snippet(data, query, 50) == server_module.extract_snippet(content, query, 50)
+
+    def test_within_chars_counts_characters(self, server_module):
+        """Test that byte offsets past multi-byte text are compared in characters."""
+        data = ("é" * 300).encode("utf-8")
+        assert server_module._within_chars(data, 400, 200)
+        assert not server_module._within_chars(data, 402, 200)
+        assert not server_module._within_chars(b"x" * 3000, 2500, 500)
+
 
 class TestListSkills:
     """Tests for _list_skills function."""
@@ -354,6 +564,12 @@ class TestGetSkill:
         assert "content" in result
         assert "Test Skill" in result["content"]
 
+    def test_serves_large_skill_from_disk(self, server_module, sample_skill, monkeypatch):
+        """Test that skills indexed without a raw copy are read from disk."""
+        monkeypatch.setattr(server_module, "LARGE_FILE_BYTES", 16)
+        result = server_module._get_skill("test-skill")
+        assert result["content"] == (sample_skill / "SKILL.md").read_text(encoding="utf-8")
+
     def test_returns_error_for_missing_skill(self, server_module, temp_skills_dir):
         """Test error returned for missing skill."""
         result = server_module._get_skill("nonexistent")
@@ -381,6 +597,28 @@ class TestGetSkill:
         server_module._get_skill("test-skill")
         assert server_module._USAGE_STATS["skill_loads"]["test-skill"] == 1
 
+    def test_serves_content_from_index(self, server_module, sample_skill):
+        """Test that indexed SKILL.md content is served without re-reading the file."""
+        server_module.get_index()
+        with patch.object(Path, "read_text") as mock_read:
+            result = server_module._get_skill("test-skill")
+        mock_read.assert_not_called()
+        assert "# Test Skill" in result["content"]
+
+    def test_serves_edits_made_before_reindex(self, server_module, sample_skill, monkeypatch):
+        """Test that a file changed since indexing is read from disk, not the index."""
+        monkeypatch.setattr(server_module, "WATCH_ENABLED", False)
+        server_module.get_index()
+        (sample_skill / "SKILL.md").write_text("# Edited on disk\n", encoding="utf-8")
+        result = server_module._get_skill("test-skill")
+        assert result["content"] == "# Edited on disk\n"
+
+    def test_normalizes_newlines_like_read_text(self, server_module, sample_skill):
+        """Test that cached content matches Path.read_text newline handling."""
+        (sample_skill / "SKILL.md").write_bytes(b"# Title\r\nLine two\r\n")
+        result = server_module._get_skill("test-skill")
+        assert result["content"] == "# Title\nLine two\n"
+
 
 class TestGetSubSkill:
     """Tests for _get_sub_skill function."""
@@ -570,6 +808,65 @@ class TestSearchContent:
         result = server_module._search_content("anything")
         assert result["results"] == []
 
+    def test_matches_word_inside_longer_token(self, server_module, sample_skill):
+        """Test that query words still match as substrings of indexed tokens."""
+        result = server_module._search_content("mock")
+        files = [r["file"] for r in result["results"]]
+        assert "references/advanced.md" in files
+
+    def test_matches_words_with_punctuation(self, server_module, sample_skill):
+        """Test that words spanning non-word characters are still found."""
+        result = server_module._search_content("unittest.mock")
+        assert result["results"][0]["file"] == "references/advanced.md"
+
+
+class TestSearchCache:
+    """Tests for search result caching."""
+
+    def test_repeat_search_uses_cache(self, server_module, sample_skill):
+        """Test that identical searches are only scored once."""
+        first = server_module._search_content("unit testing")
+        with patch.object(server_module, "score_content") as mock_score:
+            second = server_module._search_content("Unit Testing")
+        mock_score.assert_not_called()
+        assert second["results"] == first["results"]
+        assert second["query"] == "Unit Testing"
+
+    def test_reload_invalidates_cache(self, server_module, sample_skill):
+        """Test that results are recomputed after the index is reloaded."""
+        assert server_module._search_skills("brand-new")["results"] == []
+        new_dir = sample_skill.parent / "brand-new"
+        new_dir.mkdir()
+        (new_dir / "_meta.json").write_text(json.dumps({"name": "brand-new", "description": "New"}))
+        server_module._reload_index()
+        result = server_module._search_skills("brand-new")
+        assert result["results"][0]["domain"] == "brand-new"
+
+    def test_cached_results_are_not_shared(self, server_module, sample_skill):
+        """Test that mutating returned results does not corrupt the cache."""
+        server_module._search_skills("test")["results"][0]["score"] = -1
+        assert server_module._search_skills("test")["results"][0]["score"] > 0
+
+
+class TestBuildPostings:
+    """Tests for build_postings function."""
+
+    def test_maps_tokens_to_file_id_bitmasks(self, server_module, sample_skill):
+        """Test that each token maps to a bitmask of the files containing it."""
+        content_index = server_module.build_content_index()
+        keys = list(content_index)
+        postings = server_module.build_postings(content_index)
+
+        def keys_for(token):
+            return {keys[i] for i in server_module.iter_file_ids(postings[token])}
+
+        assert keys_for("mocking") == {"test-skill:references/advanced.md"}
+        assert "test-skill:SKILL.md" in keys_for("test")
+
+    def test_iter_file_ids_ascending(self, server_module):
+        """Test that set bits are yielded as ascending file ids."""
+        assert list(server_module.iter_file_ids(0b1010_0001)) == [0, 5, 7]
+
 
 class TestReloadIndex:
     """Tests for _reload_index function."""
@@ -630,6 +927,13 @@ class TestGetStats:
         assert "recent_searches" in result
         assert len(result["recent_searches"]) <= 10
 
+    def test_recent_searches_are_last_ten(self, server_module):
+        """Test that only the ten most recent searches are returned, oldest first."""
+        for i in range(15):
+            server_module.track_usage("search_skills", {"query": f"q{i}"})
+        result = server_module._get_stats()
+        assert [s["query"] for s in result["recent_searches"]] == [f"q{i}" for i in range(5, 15)]
+
     def test_returns_total_skills(self, server_module, multiple_skills):
         """Test that total skills count is returned."""
         result = server_module._get_stats()